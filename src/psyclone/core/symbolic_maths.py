@@ -38,6 +38,7 @@
 ''' This module provides access to sympy-based symbolic maths
 functions.'''
 
+from functools import lru_cache
 
 from sympy import (Complexes, ConditionSet, core, EmptySet, expand, FiniteSet,
                    ImageSet, simplify, solvers, Union)
@@ -99,6 +100,11 @@ class SymbolicMaths:
         if exp1 is None or exp2 is None:
             return exp1 == exp2
 
+        # Structurally identical PSyIR trees are always equal, which avoids
+        # the conversion to SymPy for this common case:
+        if exp1 == exp2:
+            return True
+
         diff = SymbolicMaths._subtract(exp1, exp2)
         # For ranges all values (start, stop, step) must be equal, meaning
         # each index of the difference must evaluate to 0:
@@ -127,6 +133,10 @@ class SymbolicMaths:
         # pylint: disable=import-outside-toplevel
         from psyclone.psyir.backend.visitor import VisitorError
 
+        # Structurally identical PSyIR trees are always the same:
+        if exp1 == exp2:
+            return False
+
         try:
             result = SymbolicMaths._subtract(exp1, exp2)
         except VisitorError:
@@ -162,6 +172,32 @@ class SymbolicMaths:
         # n-5), so it might be zero.
         return False
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _simplify(expr):
+        '''Simplifies the given SymPy expression. SymPy expressions are
+        immutable and hashable, and the same (sub-)expressions are typically
+        compared many times (e.g. in the dependency analysis), so the
+        results are cached.
+
+        :param expr: the SymPy expression to simplify.
+        :type expr: :py:class:`sympy.core.basic.Basic`
+
+        :returns: the simplified expression.
+        :rtype: :py:class:`sympy.core.basic.Basic`
+
+        '''
+        # Most differences compared in PSyclone are simple polynomials in
+        # the loop variables, which expand already reduces to an integer
+        # constant. This is a lot cheaper than the full simplification.
+        expanded = expand(expr)
+        if isinstance(expanded, core.numbers.Integer):
+            return expanded
+        # Otherwise simplify triggers a set of SymPy algorithms to simplify
+        # the expression.
+        return simplify(expr)
+
     # -------------------------------------------------------------------------
     @staticmethod
     def _subtract(exp1, exp2):
@@ -195,12 +231,11 @@ class SymbolicMaths:
                 isinstance(sympy_expressions[1], tuple):
             result = []
             for i, j in zip(sympy_expressions[0], sympy_expressions[1]):
-                result.append(simplify(i - j))
+                result.append(SymbolicMaths._simplify(i - j))
             return result
 
-        # Simplify triggers a set of SymPy algorithms to simplify
-        # the expression.
-        return simplify(sympy_expressions[0] - sympy_expressions[1])
+        return SymbolicMaths._simplify(sympy_expressions[0] -
+                                       sympy_expressions[1])
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -40,11 +40,15 @@
 '''This module provides management of variable access information.'''
 
 
+from psyclone.core.access_type import AccessType
 from psyclone.core.component_indices import ComponentIndices
 from psyclone.core.signature import Signature
 from psyclone.core.single_variable_access_info import SingleVariableAccessInfo
 from psyclone.errors import InternalError
 
+# All access types that write to a variable.
+_WRITE_ACCESSES = frozenset(AccessType.all_write_accesses())
+
 
 class VariablesAccessInfo(dict):
     '''This class stores all `SingleVariableAccessInfo` instances for all
@@ -104,6 +108,10 @@ class VariablesAccessInfo(dict):
                                     f"'{type(options).__name__}'.")
             self._options.update(options)
 
+        # Stores the signatures of all variables that are written at least
+        # once, so that they can be queried without checking all accesses.
+        self._written_signatures = set()
+
         # Stores the current location information
         self._location = 0
         if nodes:
@@ -272,6 +280,8 @@ class VariablesAccessInfo(dict):
             var_info.add_access_with_location(access_type, self._location,
                                               node, component_indices)
             self[signature] = var_info
+        if access_type in _WRITE_ACCESSES:
+            self._written_signatures.add(signature)
 
     @property
     def all_signatures(self):
@@ -283,6 +293,16 @@ class VariablesAccessInfo(dict):
         list_of_vars.sort()
         return list_of_vars
 
+    @property
+    def written_signatures(self):
+        ''':returns: the signatures of all variables that are written at \
+            least once. Accesses that are changed to a write after they \
+            have been added (using `change_read_to_write` of a \
+            SingleVariableAccessInfo) are not tracked.
+        :rtype: FrozenSet[:py:class:`psyclone.core.Signature`]
+        '''
+        return frozenset(self._written_signatures)
+
     def merge(self, other_access_info):
         '''Merges data from a VariablesAccessInfo instance to the
         information in this instance.
@@ -315,6 +335,8 @@ class VariablesAccessInfo(dict):
                                                   access_info.node,
                                                   access_info.
                                                   component_indices)
+                if access_info.access_type in _WRITE_ACCESSES:
+                    self._written_signatures.add(signature)
         # Increase the current location of this instance by the amount of
         # locations just merged in
         self._location = self._location + max_new_location
@@ -81,13 +81,17 @@ class LFRicExtractTrans(ExtractTrans):
         :param options: a dictionary with options for transformations.
         :type options: Optional[Dict[str, Any]]
 
+        :raises TransformationError: if the supplied argument is neither a \
+                                     single Node, nor a Schedule, nor a \
+                                     list of Nodes.
         :raises TransformationError: if transformation is applied to a Loop \
                                      over cells in a colour without its \
                                      parent Loop over colours.
         '''
 
         # First check constraints on Nodes in the node_list inherited from
-        # the parent classes (ExtractTrans and RegionTrans)
+        # the parent classes (ExtractTrans and RegionTrans). This also
+        # rejects an invalid argument before any node is inspected.
         super().validate(node_list, options)
 
         # Check LFRicExtractTrans specific constraints
@@ -40,7 +40,7 @@
 
 import keyword
 
-from sympy import Function, Symbol
+from sympy import Function, Integer, Symbol
 from sympy.parsing.sympy_parser import parse_expr
 
 from psyclone.psyir.backend.fortran import FortranWriter
@@ -98,6 +98,11 @@ class SymPyWriter(FortranWriter):
     # This class attribute will get initialised in __init__:
     _RESERVED_NAMES = set()
 
+    # A symbol table that contains only the reserved names. It is the
+    # starting point of the symbol table created for each conversion, and
+    # is also initialised in __init__:
+    _RESERVED_NAMES_TABLE = None
+
     def __init__(self):
         super().__init__()
 
@@ -125,6 +130,12 @@ class SymPyWriter(FortranWriter):
                 if reserved.lower() == reserved:
                     SymPyWriter._RESERVED_NAMES.add(reserved)
 
+        if SymPyWriter._RESERVED_NAMES_TABLE is None:
+            reserved_table = SymbolTable()
+            for reserved in SymPyWriter._RESERVED_NAMES:
+                reserved_table.new_symbol(reserved)
+            SymPyWriter._RESERVED_NAMES_TABLE = reserved_table
+
         # This dictionary will be supplied when parsing a string by SymPy
         # and defines which symbols in the parsed expressions are scalars
         # (SymPy symbols) or arrays (SymPy functions).
@@ -279,10 +290,10 @@ class SymPyWriter(FortranWriter):
         # new conversion (i.e. this avoids name clashes with a previous
         # conversion). First add all reserved names so that these names will
         # automatically be renamed. The symbol table is used later to also
-        # create guaranteed unique names for lower and upper bounds.
-        self._symbol_table = SymbolTable()
-        for reserved in SymPyWriter._RESERVED_NAMES:
-            self._symbol_table.new_symbol(reserved)
+        # create guaranteed unique names for lower and upper bounds. The
+        # reserved names are taken from a shallow copy of a shared table,
+        # which is not modified, since new symbols are only added to the copy.
+        self._symbol_table = SymPyWriter._RESERVED_NAMES_TABLE.shallow_copy()
 
         # Find each reference in each of the expression, and declare this name
         # as either a SymPy Symbol (scalar reference), or a SymPy Function
@@ -422,6 +433,15 @@ class SymPyWriter(FortranWriter):
 
         result = []
         for expr in expression_str_list:
+            # Simple scalar references and integer constants are very
+            # common, and can be created directly without invoking the
+            # (comparatively slow) SymPy parser:
+            if isinstance(self.type_map.get(expr), Symbol):
+                result.append(self.type_map[expr])
+                continue
+            if expr.isdigit():
+                result.append(Integer(expr))
+                continue
             try:
                 result.append(parse_expr(expr, self.type_map))
             except SyntaxError as err:
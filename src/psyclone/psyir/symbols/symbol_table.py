@@ -1018,11 +1018,16 @@ class SymbolTable():
                 f"Expected the tag argument to the lookup_with_tag() method "
                 f"to be a str but found '{type(tag).__name__}'.")
 
-        try:
-            return self.get_tags(scope_limit)[tag]
-        except KeyError as err:
-            raise KeyError(f"Could not find the tag '{tag}' in the Symbol "
-                           f"Table.") from err
+        # Search the tables from the closest one outwards instead of building
+        # the dictionary of all tags in scope (as get_tags does), as this is
+        # called each time a tagged symbol is looked up.
+        current = self
+        while current:
+            symbol = current.tags_dict.get(tag)
+            if symbol is not None:
+                return symbol
+            current = current.parent_symbol_table(scope_limit)
+        raise KeyError(f"Could not find the tag '{tag}' in the Symbol Table.")
 
     def __contains__(self, key):
         '''Check if the given key is part of the Symbol Table.
@@ -85,6 +85,8 @@ from psyclone.psyir.transformations.loop_fuse_trans import LoopFuseTrans
 from psyclone.psyir.transformations.loop_swap_trans import LoopSwapTrans
 from psyclone.psyir.transformations.loop_tiling_2d_trans \
     import LoopTiling2DTrans
+from psyclone.psyir.transformations.loop_tiling_nd_trans \
+    import LoopTilingNDTrans
 from psyclone.psyir.transformations.loop_trans import LoopTrans
 from psyclone.psyir.transformations.nan_test_trans import NanTestTrans
 from psyclone.psyir.transformations.omp_loop_trans import OMPLoopTrans
@@ -129,6 +131,7 @@ __all__ = ['ACCKernelsTrans',
            'LoopFuseTrans',
            'LoopSwapTrans',
            'LoopTiling2DTrans',
+           'LoopTilingNDTrans',
            'LoopTrans',
            'Maxval2LoopTrans',
            'Minval2LoopTrans',
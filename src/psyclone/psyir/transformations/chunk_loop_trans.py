@@ -40,8 +40,8 @@ chunked implementation of the Loop'''
 
 from psyclone.core import VariablesAccessInfo, Signature, AccessType
 from psyclone.psyir import nodes
-from psyclone.psyir.nodes import Assignment, BinaryOperation, Reference, \
-        Literal, Loop, Schedule, CodeBlock, IntrinsicCall
+from psyclone.psyir.nodes import Assignment, BinaryOperation, Call, \
+        CodeBlock, IntrinsicCall, Literal, Loop, Reference
 from psyclone.psyir.symbols import DataSymbol, ScalarType
 from psyclone.psyir.transformations.loop_trans import LoopTrans
 from psyclone.psyir.transformations.transformation_error import \
@@ -190,23 +190,27 @@ class ChunkLoopTrans(LoopTrans):
         bounds_ref.add_access(Signature(node.variable.name),
                               AccessType.READWRITE, self)
 
-        bounds_sigs = bounds_ref.all_signatures
+        body = node.loop_body.children
+        if (len(body) == 1 and isinstance(body[0], Assignment) and
+                all(isinstance(call, IntrinsicCall)
+                    for call in body[0].walk(Call))):
+            # The body is a single assignment without calls to other
+            # routines, so the only variable written is the one on its lhs
+            # and we can avoid collecting the accesses of the whole body.
+            sig, _ = body[0].lhs.get_signature_and_indices()
+            conflicts = {sig}.intersection(bounds_ref)
+        else:
+            # Find the Loop code's signatures
+            body_refs = VariablesAccessInfo(node.loop_body)
+            conflicts = body_refs.written_signatures.intersection(
+                bounds_ref)
 
-        # Find the Loop code's signatures
-        body_refs = VariablesAccessInfo(node.loop_body)
-        body_sigs = body_refs.all_signatures
-
-        for ref1 in bounds_sigs:
-            if ref1 not in body_sigs:
-                continue
-            access2 = body_refs[ref1]
-
-            # If access2 is a write then we write to a loop variable
-            if access2.is_written():
-                raise TransformationError(
-                    f"Cannot apply a ChunkLoopTrans to this loop because "
-                    f"the boundary variable '{access2.signature.var_name}' "
-                    f"is written to inside the loop body.")
+        # Check if any of the bounds variables is written in the loop body
+        if conflicts:
+            raise TransformationError(
+                f"Cannot apply a ChunkLoopTrans to this loop because "
+                f"the boundary variable '{min(conflicts).var_name}' "
+                f"is written to inside the loop body.")
 
     def apply(self, node, options=None):
         '''
@@ -245,6 +249,11 @@ class ChunkLoopTrans(LoopTrans):
         start = node.start_expr
         stop = node.stop_expr
 
+        # The stop expression is used both in the computation of el_inner and
+        # as the upper bound of the new outer loop. A PSyIR node can only have
+        # one parent, so it has to be copied (even if it is a Literal, which
+        # is already cheap to copy as it has no children).
+
         # For positive steps we do:
         #     el_inner = min(out_var+chunk_size-1, el_outer)
         if int(node.step_expr.value) > 0:
@@ -281,13 +290,11 @@ class ChunkLoopTrans(LoopTrans):
         start.replace_with(Reference(outer_loop_variable))
         stop.replace_with(Reference(end_inner_loop))
 
-        # Create the outerloop as a bare Loop construct
-        outerloop = Loop(variable=outer_loop_variable)
-        outerloop.children = [start, stop,
-                              Literal(f"{chunk_size}",
-                                      outer_loop_variable.datatype),
-                              Schedule(parent=outerloop,
-                                       children=[inner_loop_end])]
+        # Create the outerloop with all its children in one go
+        outerloop = Loop.create(outer_loop_variable, start, stop,
+                                Literal(f"{chunk_size}",
+                                        outer_loop_variable.datatype),
+                                [inner_loop_end])
         # Add the chunked annotation
         outerloop.annotations.append('chunked')
         node.annotations.append('chunked')
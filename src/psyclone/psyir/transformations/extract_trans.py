@@ -145,6 +145,9 @@ class ExtractTrans(PSyDataTrans):
         :param options: a dictionary with options for transformations.
         :type options: Optional[Dict[str, Any]]
 
+        :raises TransformationError: if the supplied argument is neither a \
+                                     single Node, nor a Schedule, nor a \
+                                     list of Nodes.
         :raises TransformationError: if distributed memory is configured.
         :raises TransformationError: if transformation is applied to a \
                                      Kernel or a BuiltIn call without its \
@@ -156,6 +159,11 @@ class ExtractTrans(PSyDataTrans):
                                      orphaned Directive without its parent \
                                      Directive.
         '''
+        # Convert the argument to a list of nodes before any node is
+        # inspected, so that an invalid argument is reported as such. The
+        # base classes' validate methods call get_node_list again, which
+        # for a list of nodes only makes a (cheap) shallow copy.
+        node_list = self.get_node_list(node_list)
 
         # Check ExtractTrans specific constraints.
 
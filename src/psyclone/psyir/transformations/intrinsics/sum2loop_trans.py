@@ -88,6 +88,11 @@ class Sum2LoopTrans(ArrayReductionBaseTrans):
             IF (MOD(ARRAY(I,J), 2.0)==1) THEN
               R = R + ARRAY(I,J)
 
+    The accumulation is kept as a single scalar update in the innermost
+    loop, which is the reduction idiom that compilers recognise and
+    vectorise. If the back-end provides a better implementation of the
+    SUM intrinsic this transformation should simply not be applied.
+
     The dimension argument is currently not supported and will result
     in a TransformationError exception being raised.
 
@@ -37,7 +37,6 @@
 '''This module provides the LoopTiling2DTrans, which transforms a 2D Loop
 construct into a tiled implementation of the construct.'''
 
-from psyclone.psyir.nodes import Loop
 from psyclone.psyir.transformations.chunk_loop_trans import ChunkLoopTrans
 from psyclone.psyir.transformations.loop_swap_trans import LoopSwapTrans
 from psyclone.psyir.transformations.loop_trans import LoopTrans
@@ -107,6 +106,8 @@ class LoopTiling2DTrans(LoopTrans):
             provided.
         :raises TransformationError: if the provided tilesize is not a \
             integer.
+        :raises TransformationError: if any of the two loops in the \
+            construct can not be chunked with the provided tilesize.
         '''
         if options is None:
             options = {}
@@ -144,10 +145,45 @@ class LoopTiling2DTrans(LoopTrans):
         LoopSwapTrans().validate(node)
 
         # Check that we can chunk both loops
-        outer_loop = node
-        inner_loop = node.loop_body.children[0]
-        ChunkLoopTrans().validate(outer_loop, options={'chunksize': tilesize})
-        ChunkLoopTrans().validate(inner_loop, options={'chunksize': tilesize})
+        chunk_trans = ChunkLoopTrans()
+        for description, loop in (("outer", node),
+                                  ("inner", node.loop_body.children[0])):
+            try:
+                chunk_trans.validate(loop, options={'chunksize': tilesize})
+            except TransformationError as err:
+                raise TransformationError(
+                    f"Error in LoopTiling2DTrans transformation. The "
+                    f"{description} loop over '{loop.variable.name}' can not "
+                    f"be tiled with a tilesize of {tilesize} because:\n"
+                    f"{err.value}") from err
+
+    def validate_all(self, loops, options=None):
+        '''
+        Validates each of the supplied loops without stopping at the first
+        one that can not be transformed. This allows scripts to select the
+        loops that will be tiled without having to catch and retry the
+        transformation for each of them.
+
+        :param loops: the loops to validate.
+        :type loops: List[:py:class:`psyclone.psyir.nodes.Loop`]
+        :param options: a dict with options for transformation.
+        :type options: Optional[Dict[str, Any]]
+
+        :returns: a (loop, valid, reason) tuple for each supplied loop, where
+            reason is the validation error message or an empty string if
+            the loop is valid.
+        :rtype: List[Tuple[:py:class:`psyclone.psyir.nodes.Loop`, bool, str]]
+
+        '''
+        results = []
+        for loop in loops:
+            try:
+                self.validate(loop, options)
+            except TransformationError as err:
+                results.append((loop, False, str(err.value)))
+            else:
+                results.append((loop, True, ""))
+        return results
 
     def apply(self, node, options=None):
         '''
@@ -167,13 +203,14 @@ class LoopTiling2DTrans(LoopTrans):
         if options is None:
             options = {}
         tilesize = options.get("tilesize", 32)
-        parent = node.parent
-        position = node.position
         outer_loop = node
         inner_loop = node.loop_body.children[0]
 
         ChunkLoopTrans().apply(outer_loop, options={'chunksize': tilesize})
         ChunkLoopTrans().apply(inner_loop, options={'chunksize': tilesize})
 
-        loops = parent[position].walk(Loop)[1]
-        LoopSwapTrans().apply(loops)
+        # ChunkLoopTrans keeps the original loop nodes as the inner loops of
+        # each chunked pair, so the original outer loop now contains the
+        # chunk loop of the original inner loop and these are the two loops
+        # that need to be swapped.
+        LoopSwapTrans().apply(outer_loop)
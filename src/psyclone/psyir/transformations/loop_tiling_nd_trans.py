@@ -0,0 +1,250 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2024, Science and Technology Facilities Council.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# -----------------------------------------------------------------------------
+
+'''This module provides the LoopTilingNDTrans, which transforms a nest of N
+perfectly nested Loops into a tiled implementation of the construct.'''
+
+from psyclone.psyir.nodes import Reference
+from psyclone.psyir.transformations.chunk_loop_trans import ChunkLoopTrans
+from psyclone.psyir.transformations.loop_swap_trans import LoopSwapTrans
+from psyclone.psyir.transformations.loop_trans import LoopTrans
+from psyclone.psyir.transformations.transformation_error import \
+    TransformationError
+
+
+class LoopTilingNDTrans(LoopTrans):
+    '''
+    Apply an N-dimensional loop tiling transformation to a nest of
+    perfectly nested loops, where N is given by the number of tile sizes
+    provided. For example:
+
+    >>> from psyclone.psyir.frontend.fortran import FortranReader
+    >>> from psyclone.psyir.nodes import Loop
+    >>> from psyclone.psyir.transformations import LoopTilingNDTrans
+    >>> psyir = FortranReader().psyir_from_source("""
+    ... subroutine sub()
+    ...     integer :: i, j, k, tmp(100, 100, 100)
+    ...     do i=1, 100
+    ...       do j=1, 100
+    ...         do k=1, 100
+    ...           tmp(i, j, k) = 2 * tmp(i, j, k)
+    ...         enddo
+    ...       enddo
+    ...     enddo
+    ... end subroutine sub""")
+    >>> loop = psyir.walk(Loop)[0]
+    >>> LoopTilingNDTrans().apply(loop, {"tilesizes": [32, 32, 16]})
+
+    will generate:
+
+    .. code-block:: fortran
+
+        do i_out_var = 1, 100, 32
+          i_el_inner = MIN(i_out_var + (32 - 1), 100)
+          do j_out_var = 1, 100, 32
+            j_el_inner = MIN(j_out_var + (32 - 1), 100)
+            do k_out_var = 1, 100, 16
+              k_el_inner = MIN(k_out_var + (16 - 1), 100)
+              do i = i_out_var, i_el_inner, 1
+                do j = j_out_var, j_el_inner, 1
+                  do k = k_out_var, k_el_inner, 1
+                    tmp(i,j,k) = 2 * tmp(i,j,k)
+                  enddo
+                enddo
+              enddo
+            enddo
+          enddo
+        enddo
+
+    Unlike applying LoopTiling2DTrans to successive pairs of loops, all the
+    loops of the nest are tiled jointly, and the computation of the upper
+    bound of each tile is placed directly inside its tile loop.
+
+    '''
+    def __str__(self):
+        return "Tile the loop construct using N-dimensional blocks"
+
+    @staticmethod
+    def _get_tilesizes(options):
+        '''
+        :param options: a dict with options for transformation.
+        :type options: Dict[str, Any]
+
+        :returns: the tile size of each loop of the nest.
+        :rtype: List[int]
+
+        '''
+        return list(options.get("tilesizes", [32, 32]))
+
+    def validate(self, node, options=None):
+        '''
+        Validates that the given Loop node can have a LoopTilingNDTrans
+        applied.
+
+        :param node: the outermost loop of the nest to validate.
+        :type node: :py:class:`psyclone.psyir.nodes.Loop`
+        :param options: a dict with options for transformation.
+        :type options: Optional[Dict[str, Any]]
+        :param options["tilesizes"]: the size of the tile for each loop in
+            the nest, starting from the outermost one. The number of values
+            determines the number of loops that are tiled. If not specified,
+            the two outermost loops are tiled with a tile size of 32.
+        :type options["tilesizes"]: List[int] | Tuple[int, ...]
+
+        :raises TransformationError: if an unsupported option has been
+            provided.
+        :raises TransformationError: if the provided tilesizes are not a
+            list or tuple of at least two positive integers.
+        :raises TransformationError: if the nest does not contain as many
+            perfectly nested loops as tile sizes have been provided.
+        :raises TransformationError: if the boundary expressions of a loop
+            use the iteration variable of an enclosing loop of the nest.
+        :raises TransformationError: if any of the loops in the nest can
+            not be chunked with its provided tile size.
+        '''
+        if options is None:
+            options = {}
+        super().validate(node, options=options)
+
+        # Validate options map
+        # TODO #613: Hardcoding the valid_options does not allow for
+        # subclassing this transformation and adding new options, this
+        # should be fixed.
+        valid_options = ['tilesizes']
+        for key, value in options.items():
+            if key not in valid_options:
+                raise TransformationError(
+                    f"The LoopTilingNDTrans does not support the "
+                    f"transformation option '{key}', the supported options "
+                    f"are: {valid_options}.")
+            if not isinstance(value, (list, tuple)) or len(value) < 2:
+                raise TransformationError(
+                    f"The LoopTilingNDTrans tilesizes option must be a list "
+                    f"or tuple with at least two positive integers but found "
+                    f"'{value}'.")
+            for tilesize in value:
+                if (isinstance(tilesize, bool) or
+                        not isinstance(tilesize, int) or tilesize <= 0):
+                    raise TransformationError(
+                        f"The LoopTilingNDTrans tilesizes option must only "
+                        f"contain positive integers but found '{tilesize}'.")
+
+        tilesizes = self._get_tilesizes(options)
+
+        # Check that each pair of consecutive loops can be swapped. This
+        # guarantees that each loop (but the innermost one) has exactly one
+        # loop statement inside, as swapping the two original loops has the
+        # same constraints as swapping the loops resulting from the chunking.
+        loops = [node]
+        for _ in range(len(tilesizes) - 1):
+            try:
+                LoopSwapTrans().validate(loops[-1])
+            except TransformationError as err:
+                raise TransformationError(
+                    f"Error in LoopTilingNDTrans transformation. The loop "
+                    f"nest must contain {len(tilesizes)} perfectly nested "
+                    f"loops but:\n{err.value}") from err
+            loops.append(loops[-1].loop_body.children[0])
+
+        # LoopSwapTrans only checks the boundaries of adjacent loops, but
+        # all the tile loops will be moved outside all the element loops.
+        for position, loop in enumerate(loops):
+            symbols = set()
+            for boundary in (loop.start_expr, loop.stop_expr,
+                             loop.step_expr):
+                symbols.update(ref.symbol for ref in boundary.walk(Reference))
+            for outer_loop in loops[:position]:
+                if outer_loop.variable in symbols:
+                    raise TransformationError(
+                        f"Error in LoopTilingNDTrans transformation. The "
+                        f"iteration variable '{outer_loop.variable.name}' is "
+                        f"part of the boundary expressions of the inner loop "
+                        f"over '{loop.variable.name}', so the nest can not "
+                        f"be tiled.")
+
+        # Check that we can chunk all the loops
+        chunk_trans = ChunkLoopTrans()
+        for loop, tilesize in zip(loops, tilesizes):
+            try:
+                chunk_trans.validate(loop, options={'chunksize': tilesize})
+            except TransformationError as err:
+                raise TransformationError(
+                    f"Error in LoopTilingNDTrans transformation. The loop "
+                    f"over '{loop.variable.name}' can not be tiled with a "
+                    f"tilesize of {tilesize} because:\n{err.value}") from err
+
+    def apply(self, node, options=None):
+        '''
+        Converts the given nest of Loops into a tiled version of the nested
+        loops.
+
+        :param node: the outermost loop of the nest to transform.
+        :type node: :py:class:`psyclone.psyir.nodes.Loop`
+        :param options: a dict with options for transformations.
+        :type options: Optional[Dict[str, Any]]
+        :param options["tilesizes"]: the size of the tile for each loop in
+            the nest, starting from the outermost one. The number of values
+            determines the number of loops that are tiled. If not specified,
+            the two outermost loops are tiled with a tile size of 32.
+        :type options["tilesizes"]: List[int] | Tuple[int, ...]
+
+        '''
+        self.validate(node, options)
+        if options is None:
+            options = {}
+        tilesizes = self._get_tilesizes(options)
+
+        element_loops = [node]
+        for _ in range(len(tilesizes) - 1):
+            element_loops.append(element_loops[-1].loop_body.children[0])
+
+        # Chunk each loop. ChunkLoopTrans keeps the original loop as the
+        # element loop of each chunked pair, inside a new tile loop whose body
+        # first computes the upper bound of the tile.
+        for loop, tilesize in zip(element_loops, tilesizes):
+            ChunkLoopTrans().apply(loop, options={'chunksize': tilesize})
+        tile_loops = [loop.parent.parent for loop in element_loops]
+
+        # Re-nest all the tile loops outside all the element loops by
+        # detaching each of them from its current parent and adding them
+        # back in the new order.
+        for tile_loop, element_loop in zip(tile_loops[1:], element_loops):
+            tile_loop.detach()
+            element_loop.detach()
+        element_loops[-1].detach()
+        for outer, inner in zip(tile_loops, tile_loops[1:]):
+            outer.loop_body.addchild(inner)
+        tile_loops[-1].loop_body.addchild(element_loops[0])
+        for outer, inner in zip(element_loops, element_loops[1:]):
+            outer.loop_body.addchild(inner)
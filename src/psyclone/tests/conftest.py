@@ -47,11 +47,13 @@ from fparser.two.parser import ParserFactory
 from fparser.two.symbol_table import SYMBOL_TABLES
 from psyclone.configuration import Config
 from psyclone.parse import ModuleManager
+from psyclone.parse.algorithm import parse
+from psyclone.psyGen import PSyFactory
 from psyclone.psyir.backend.fortran import FortranWriter
 from psyclone.psyir.frontend.fortran import FortranReader
 from psyclone.tests.gocean_build import GOceanBuild
 from psyclone.tests.lfric_build import LFRicBuild
-from psyclone.tests.utilities import Compile
+from psyclone.tests.utilities import Compile, get_base_path
 
 
 # fixtures defined here are available to all tests
@@ -242,6 +244,76 @@ def fixture_lfric_config():
     Config.get().api = "lfric"
 
 
+@pytest.fixture(name="_alg_info_cache", scope="session")
+def fixture_alg_info_cache():
+    '''
+    :returns: a dictionary, shared by all tests of a session, that maps
+        the API and name of an algorithm file to the information about its
+        invokes.
+    :rtype: Dict[Tuple[str, str], :py:class:`psyclone.parse.FileInfo`]
+    '''
+    return {}
+
+
+@pytest.fixture(name="get_cached_invoke")
+def fixture_get_cached_invoke(_alg_info_cache):
+    '''Provides a replacement for ``get_invoke`` that takes the same
+    arguments. Parsing an algorithm file (and all kernels it uses) is the
+    most expensive part of most transformation tests, so each file is only
+    parsed once per session. A new PSy object is still created for each
+    call, so tests can freely modify the returned schedule.
+
+    Note that the information about the invokes is only read, not modified,
+    when creating a PSy object, unless the kernel arguments of an LFRic
+    invoke use stencils (which get unique names assigned). The fixture must
+    therefore not be used with algorithm files that use stencils.
+
+    :returns: a function that takes the name of an algorithm file, the API,
+        the index or name of the invoke and whether distributed memory is
+        used, and returns a 2-tuple of the PSy object and the requested
+        invoke.
+    :rtype: Callable[[str, str, Optional[int], Optional[str],
+                      Optional[bool]],
+                     Tuple[:py:class:`psyclone.psyGen.PSy`,
+                           :py:class:`psyclone.psyGen.Invoke`]]
+    '''
+    def _get_invoke(algfile, api, idx=None, name=None, dist_mem=None):
+        if (idx is None and not name) or (idx is not None and name):
+            raise RuntimeError("Either the index or the name of the "
+                               "requested invoke must be specified")
+        Config.get().api = api
+        if (api, algfile) not in _alg_info_cache:
+            _, info = parse(os.path.join(get_base_path(api), algfile),
+                            api=api)
+            _alg_info_cache[(api, algfile)] = info
+        psy = PSyFactory(api, distributed_memory=dist_mem).create(
+            _alg_info_cache[(api, algfile)])
+        if name:
+            return psy, psy.invokes.get(name)
+        return psy, psy.invokes.invoke_list[idx]
+
+    return _get_invoke
+
+
+@pytest.fixture(name="get_lfric_invoke")
+def fixture_get_lfric_invoke(get_cached_invoke):
+    '''Provides a cached version of ``get_invoke`` for LFRic algorithm
+    files, see ``get_cached_invoke``.
+
+    :returns: a function that takes the name of an algorithm file, the
+        index of the invoke and whether distributed memory is used, and
+        returns a 2-tuple of the PSy object and the requested invoke.
+    :rtype: Callable[[str, int, bool],
+                     Tuple[:py:class:`psyclone.psyGen.PSy`,
+                           :py:class:`psyclone.psyGen.Invoke`]]
+    '''
+    def _get_invoke(algfile, idx=0, dist_mem=False):
+        return get_cached_invoke(algfile, "lfric", idx=idx,
+                                 dist_mem=dist_mem)
+
+    return _get_invoke
+
+
 @pytest.fixture(scope="function", autouse=True)
 def fixture_tear_down_config():
     ''' Whatever API we use (by using the previous fixtures or by the test
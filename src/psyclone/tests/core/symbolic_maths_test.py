@@ -37,11 +37,86 @@
 
 ''' Module containing py.test tests for the symbolic maths class.'''
 
+from functools import lru_cache
+
 import pytest
 from sympy import solvers, Symbol
 
 from psyclone.core import SymbolicMaths
 from psyclone.psyir.backend.sympy_writer import SymPyWriter
+from psyclone.psyir.frontend.fortran import FortranReader
+
+
+# The fixed start and end of the dummy programs used in this file
+_PROG_PREFIX = "program test_prog\nuse some_mod\n"
+_PROG_SUFFIX = "end program test_prog\n"
+
+
+@lru_cache(maxsize=None)
+def _parse_expression_pairs(declarations, pairs):
+    '''Creates the PSyIR of a single dummy program that assigns all
+    expressions in `pairs`, and returns a dictionary that maps each pair
+    of expressions to the right-hand sides of its two assignments.
+    Parsing is the most expensive part of most tests in this file, so all
+    expressions used by one test are parsed together, and the result is
+    cached. The returned nodes are shared between tests and must never be
+    modified, so tests must only access them via `_get_rhs_pair`, which
+    returns copies.
+
+    :param str declarations: the declarations of the variables used in the
+        expressions.
+    :param pairs: the pairs of Fortran expressions.
+    :type pairs: Tuple[Tuple[str, str], ...]
+
+    :returns: the PSyIR of the two expressions of each pair.
+    :rtype: Dict[Tuple[str, str],
+                 Tuple[:py:class:`psyclone.psyir.nodes.Node`,
+                       :py:class:`psyclone.psyir.nodes.Node`]]
+
+    '''
+    assignments = "\n".join(f"x = {exp1}\nx = {exp2}"
+                            for exp1, exp2 in pairs)
+    source = f"{_PROG_PREFIX}{declarations}\n{assignments}\n{_PROG_SUFFIX}"
+    psyir = FortranReader().psyir_from_source(source)
+    schedule = psyir.children[0]
+    return {pair: (schedule[2*idx].rhs, schedule[2*idx+1].rhs)
+            for idx, pair in enumerate(pairs)}
+
+
+def _get_rhs_pair(declarations, cases, exp1, exp2):
+    '''Returns the PSyIR of the right-hand sides of the two expressions
+    `exp1` and `exp2`, which must be one of the pairs in `cases`. All
+    pairs in `cases` are parsed together (see `_parse_expression_pairs`).
+    Copies are returned, so the caller can modify them without affecting
+    the cached PSyIR used by other tests.
+
+    :param str declarations: the declarations of the variables used in the
+        expressions.
+    :param cases: the test cases, each starting with two expressions.
+    :type cases: List[Tuple[str, str, ...]]
+    :param str exp1: the first Fortran expression.
+    :param str exp2: the second Fortran expression.
+
+    :returns: a copy of the PSyIR of the two expressions.
+    :rtype: Tuple[:py:class:`psyclone.psyir.nodes.Node`,
+                  :py:class:`psyclone.psyir.nodes.Node`]
+
+    '''
+    pairs = tuple((case[0], case[1]) for case in cases)
+    rhs1, rhs2 = _parse_expression_pairs(declarations, pairs)[(exp1, exp2)]
+    return rhs1.copy(), rhs2.copy()
+
+
+@pytest.fixture(name="sym_maths", scope="module")
+def fixture_sym_maths():
+    '''Returns the SymbolicMaths instance shared by all tests in this
+    module.'''
+    return SymbolicMaths.get()
+
+
+# The declarations used by most tests in this file
+DECLARATIONS = """integer :: i, j, k, x
+                type(my_mod_type) :: a, b"""
 
 
 def test_sym_maths_get():
@@ -59,192 +134,167 @@ def test_sym_maths_get():
     assert sym_maths.equal(2, None) is False
 
 
-@pytest.mark.parametrize("expressions", [(".true.", ".TRUE."),
-                                         (".false.", ".FALSE."),
-                                         ])
-def test_math_logicals(fortran_reader, expressions):
+LOGICAL_EXPRESSIONS = [(".true.", ".TRUE."),
+                       (".false.", ".FALSE."),
+                       ]
+
+
+@pytest.mark.parametrize("expressions", LOGICAL_EXPRESSIONS)
+def test_math_logicals(sym_maths, expressions):
     '''Test that the sympy based comparison handles logical constants
     as expected.
     '''
-    # A dummy program to easily create the PSyIR for the
-    # expressions we need. We just take the RHS of the assignments
-    source = f'''program test_prog
-                logical :: x
-                x = {expressions[0]}
-                x = {expressions[1]}
-                end program test_prog
-                '''
-    psyir = fortran_reader.psyir_from_source(source)
-    schedule = psyir.children[0]
-
-    sym_maths = SymbolicMaths.get()
-    assert sym_maths.equal(schedule[0].rhs, schedule[1].rhs) is True
-
-
-@pytest.mark.parametrize("expressions", [("i", "i"),
-                                         ("2", "1+1"),
-                                         ("123_4", "123_8"),
-                                         ("123_4", "120+3"),
-                                         ("123_xx", "123"),
-                                         ("1.23E5", "123000"),
-                                         ("1.23D5", "123000"),
-                                         ("1.0E+3", "1000"),
-                                         ("1.0", "1"),
-                                         ("0.01E-3", "0.00001"),
-                                         ("3.14e-2", "0.0314"),
-                                         ("2.0", "1.1+0.9"),
-                                         ("2", "1+7*i-3-4*i-3*i+4"),
-                                         ("i+j", "j+i"),
-                                         ("i+j+k", "i+k+j"),
-                                         ("i+i", "2*i"),
-                                         ("i+j-2*k+3*j-2*i", "-i+4*j-2*k")
-                                         ])
-def test_symbolic_math_equal(fortran_reader, expressions):
+    rhs1, rhs2 = _get_rhs_pair("logical :: x", LOGICAL_EXPRESSIONS,
+                               *expressions)
+    assert sym_maths.equal(rhs1, rhs2) is True
+
+
+EQUAL_EXPRESSIONS = [("i", "i"),
+                     ("2", "1+1"),
+                     ("123_4", "123_8"),
+                     ("123_4", "120+3"),
+                     ("123_xx", "123"),
+                     ("1.23E5", "123000"),
+                     ("1.23D5", "123000"),
+                     ("1.0E+3", "1000"),
+                     ("1.0", "1"),
+                     ("0.01E-3", "0.00001"),
+                     ("3.14e-2", "0.0314"),
+                     ("2.0", "1.1+0.9"),
+                     ("2", "1+7*i-3-4*i-3*i+4"),
+                     ("i+j", "j+i"),
+                     ("i+j+k", "i+k+j"),
+                     ("i+i", "2*i"),
+                     ("i+j-2*k+3*j-2*i", "-i+4*j-2*k")
+                     ]
+
+
+@pytest.mark.parametrize("expressions", EQUAL_EXPRESSIONS)
+def test_symbolic_math_equal(sym_maths, expressions):
     '''Test that the sympy based comparison handles complex
     expressions that are equal.
 
     '''
-    # A dummy program to easily create the PSyIR for the
-    # expressions we need. We just take the RHS of the assignments
-    source = f'''program test_prog
-                use some_mod
-                integer :: i, j, k, x
-                type(my_mod_type) :: a, b
-                x = {expressions[0]}
-                x = {expressions[1]}
-                end program test_prog
-                '''
-    psyir = fortran_reader.psyir_from_source(source)
-    schedule = psyir.children[0]
-
-    sym_maths = SymbolicMaths.get()
-    assert sym_maths.equal(schedule[0].rhs, schedule[1].rhs) is True
-
-
-@pytest.mark.parametrize("expressions", [("a%b", "a%b"),
-                                         ("c", "c(::,::)"),
-                                         ("a%b(i)", "a%b(i)"),
-                                         ("a%b(2*i)", "a%b(3*i-i)"),
-                                         ("a%b(i-1)%c(j+1)",
-                                          "a%b(-1+i)%c(1+j)"),
-                                         ("c(i,j)%b(i,j)", "c(i,j)%b(i,j)"),
-                                         ("c(i+k,j-1-2*j)%b(2*i-i,j+3*k)",
-                                          "c(k+i,-1-j)%b(i,3*k+j)"),
-                                         ("a%b%c%d", "a%b%c%d")
-                                         ])
-def test_symbolic_math_equal_structures(fortran_reader, expressions):
+    rhs1, rhs2 = _get_rhs_pair(DECLARATIONS, EQUAL_EXPRESSIONS,
+                               *expressions)
+    assert sym_maths.equal(rhs1, rhs2) is True
+
+
+EQUAL_STRUCTURE_EXPRESSIONS = [("a%b", "a%b+0"),
+                               ("c", "c(::,::)"),
+                               ("a%b(i)", "a%b(i+1-1)"),
+                               ("a%b(2*i)", "a%b(3*i-i)"),
+                               ("a%b(i-1)%c(j+1)",
+                                "a%b(-1+i)%c(1+j)"),
+                               ("c(i,j)%b(i,j)", "c(1*i,j)%b(i,1*j)"),
+                               ("c(i+k,j-1-2*j)%b(2*i-i,j+3*k)",
+                                "c(k+i,-1-j)%b(i,3*k+j)"),
+                               ("a%b%c%d", "0+a%b%c%d")
+                               ]
+
+
+@pytest.mark.parametrize("expressions", EQUAL_STRUCTURE_EXPRESSIONS)
+def test_symbolic_math_equal_structures(sym_maths, expressions):
     '''Test that the sympy based comparison handles structures as expected.
 
     '''
-    # A dummy program to easily create the PSyIR for the
-    # expressions we need. We just take the RHS of the assignments
-    source = f'''program test_prog
-                use some_mod
-                integer :: i, j, k
-                type(my_mod_type) :: a, b, c(:,:)
-                x = {expressions[0]}
-                x = {expressions[1]}
-                end program test_prog
-                '''
-    psyir = fortran_reader.psyir_from_source(source)
-    schedule = psyir.children[0]
+    rhs1, rhs2 = _get_rhs_pair("""integer :: i, j, k
+                type(my_mod_type) :: a, b, c(:,:)""",
+                               EQUAL_STRUCTURE_EXPRESSIONS, *expressions)
+    assert sym_maths.equal(rhs1, rhs2) is True
 
-    sym_maths = SymbolicMaths.get()
-    assert sym_maths.equal(schedule[0].rhs, schedule[1].rhs) is True
+
+NOT_EQUAL_EXPRESSIONS = [("i", "0"),
+                         ("i", "j"),
+                         ("2", "1+1-1"),
+                         ("i+j", "j+i+1"),
+                         ("i-j", "j-i"),
+                         ("max(1, 2)", "max(1, 2, 3)")
+                         ]
 
 
-@pytest.mark.parametrize("expressions", [("i", "0"),
-                                         ("i", "j"),
-                                         ("2", "1+1-1"),
-                                         ("i+j", "j+i+1"),
-                                         ("i-j", "j-i"),
-                                         ("max(1, 2)", "max(1, 2, 3)")
-                                         ])
-def test_symbolic_math_not_equal(fortran_reader, expressions):
+@pytest.mark.parametrize("expressions", NOT_EQUAL_EXPRESSIONS)
+def test_symbolic_math_not_equal(sym_maths, expressions):
     '''Test that the sympy based comparison handles complex
     expressions that are not equal.
 
     '''
-    # A dummy program to easily create the PSyIR for the
-    # expressions we need. We just take the RHS of the assignments
-    source = f'''program test_prog
-                use some_mod
-                integer :: i, j, k, x
-                type(my_mod_type) :: a, b
-                x = {expressions[0]}
-                x = {expressions[1]}
-                end program test_prog
-                '''
-    psyir = fortran_reader.psyir_from_source(source)
-    schedule = psyir.children[0]
+    rhs1, rhs2 = _get_rhs_pair(DECLARATIONS, NOT_EQUAL_EXPRESSIONS,
+                               *expressions)
+    assert sym_maths.equal(rhs1, rhs2) is False
 
-    sym_maths = SymbolicMaths.get()
-    assert sym_maths.equal(schedule[0].rhs, schedule[1].rhs) is False
+
+NOT_EQUAL_STRUCTURE_EXPRESSIONS = [("a%b", "a%c"),
+                                   ("a%b(i)", "a%b(i+1)"),
+                                   ("a%b(i)%c(k)", "a%b(i+1)%c(k)"),
+                                   ("a%b(i)%c(k)", "a%b(i)%c(k+1)"),
+                                   ("a%b(i+1)%c(k)", "a%b(i)%c(k+1)"),
+                                   ]
 
 
-@pytest.mark.parametrize("expressions", [("a%b", "a%c"),
-                                         ("a%b(i)", "a%b(i+1)"),
-                                         ("a%b(i)%c(k)", "a%b(i+1)%c(k)"),
-                                         ("a%b(i)%c(k)", "a%b(i)%c(k+1)"),
-                                         ("a%b(i+1)%c(k)", "a%b(i)%c(k+1)"),
-                                         ])
-def test_symbolic_math_not_equal_structures(fortran_reader, expressions):
+@pytest.mark.parametrize("expressions", NOT_EQUAL_STRUCTURE_EXPRESSIONS)
+def test_symbolic_math_not_equal_structures(sym_maths, expressions):
     '''Test that the sympy based comparison handles complex
     expressions that are not equal.
 
     '''
-    # A dummy program to easily create the PSyIR for the
-    # expressions we need. We just take the RHS of the assignments
-    source = f'''program test_prog
-                use some_mod
-                integer :: i, j, k, x
-                type(my_mod_type) :: a, b
-                x = {expressions[0]}
-                x = {expressions[1]}
-                end program test_prog
-                '''
-    psyir = fortran_reader.psyir_from_source(source)
-    schedule = psyir.children[0]
-
-    sym_maths = SymbolicMaths.get()
-
-    assert sym_maths.equal(schedule[0].rhs, schedule[1].rhs) is False
-
-
-@pytest.mark.parametrize("exp1, exp2, result", [("i", "0", False),
-                                                ("i", "j", False),
-                                                ("2", "1+1-1", True),
-                                                ("2", "1+1", False),
-                                                ("i", "i+1", True),
-                                                ("i+j", "j+i+1", True),
-                                                ("i-j", "j-i", False),
-                                                ("max(1, 2)",
-                                                 "max(1, 2, 3)", True),
-                                                ("a(:)", "b(:)", False),
-                                                ])
-def test_symbolic_math_never_equal(fortran_reader, exp1, exp2, result):
+    rhs1, rhs2 = _get_rhs_pair(DECLARATIONS, NOT_EQUAL_STRUCTURE_EXPRESSIONS,
+                               *expressions)
+    assert sym_maths.equal(rhs1, rhs2) is False
+
+
+NEVER_EQUAL_EXPRESSIONS = [("i", "0", False),
+                           ("i", "j", False),
+                           ("2", "1+1-1", True),
+                           ("2", "1+1", False),
+                           ("i", "i+1", True),
+                           ("i+j", "j+i+1", True),
+                           ("i-j", "j-i", False),
+                           ("max(1, 2)",
+                            "max(1, 2, 3)", True),
+                           ("a(:)", "b(:)", False),
+                           ]
+
+
+@pytest.mark.parametrize("exp1, exp2, result", NEVER_EQUAL_EXPRESSIONS)
+def test_symbolic_math_never_equal(sym_maths, exp1, exp2, result):
     '''Test that the sympy based comparison handles complex
     expressions that are tested for never equal.
 
     '''
-    # A dummy program to easily create the PSyIR for the
-    # expressions we need. We just take the RHS of the assignments
-    source = f'''program test_prog
-                use some_mod
-                integer :: i, j, k, x
-                type(my_mod_type) :: a, b
-                x = {exp1}
-                x = {exp2}
-                end program test_prog
-                '''
-    psyir = fortran_reader.psyir_from_source(source)
+    rhs1, rhs2 = _get_rhs_pair(DECLARATIONS, NEVER_EQUAL_EXPRESSIONS,
+                               exp1, exp2)
+    assert sym_maths.never_equal(rhs1, rhs2) is result
+
+
+def test_symbolic_maths_simplify_cache(sym_maths, fortran_reader):
+    '''Test that the simplification of the difference of two expressions
+    is cached, so comparing the same expressions again does not invoke
+    SymPy's simplify.'''
+    psyir = fortran_reader.psyir_from_source(
+        f"{_PROG_PREFIX}integer :: i, j, x\nx = 2*i+j-i\nx = j+i\n"
+        f"{_PROG_SUFFIX}")
     schedule = psyir.children[0]
+    assert sym_maths.equal(schedule[0].rhs, schedule[1].rhs) is True
+    hits = SymbolicMaths._simplify.cache_info().hits
+    assert sym_maths.equal(schedule[0].rhs, schedule[1].rhs) is True
+    assert SymbolicMaths._simplify.cache_info().hits == hits + 1
 
-    sym_maths = SymbolicMaths.get()
-    assert sym_maths.never_equal(schedule[0].rhs, schedule[1].rhs) is result
 
+def test_symbolic_maths_structural_equal(sym_maths, monkeypatch):
+    '''Test that structurally identical expressions are compared without
+    converting them to SymPy.'''
+    rhs1, rhs2 = _get_rhs_pair(DECLARATIONS, [("a%b", "a%b")], "a%b", "a%b")
+
+    def _raise(_exp1, _exp2):
+        raise NotImplementedError("SymPy must not be used")
+
+    monkeypatch.setattr(SymbolicMaths, "_subtract", staticmethod(_raise))
+    assert sym_maths.equal(rhs1, rhs2) is True
+    assert sym_maths.never_equal(rhs1, rhs2) is False
 
-def test_symbolic_maths_never_equal_error(fortran_reader):
+
+def test_symbolic_maths_never_equal_error(sym_maths, fortran_reader):
     '''Test the never_equal method with an invalid SymPy expression, to make
     sure it hides any exception. We use an array assignment using (/ ... /),
     which is not valid in SymPy.'''
@@ -255,53 +305,44 @@ def test_symbolic_maths_never_equal_error(fortran_reader):
         "end program test_prog\n")
     psyir = fortran_reader.psyir_from_source(source)
     assignment = psyir.children[0][0]
-    sym_maths = SymbolicMaths.get()
     assert sym_maths.never_equal(assignment.lhs, assignment.rhs) is False
 
 
-@pytest.mark.parametrize("exp1, exp2, result", [("i", "2*i+1", set([-1])),
-                                                # Infinite solutions (i is any
-                                                # integer) are returned as
-                                                # string "independent"
-                                                ("i", "i", "independent"),
-                                                # Indirect addressing cannot be
-                                                # resolved, sympy returns a
-                                                # ConditionSet, which must be
-                                                # returned as 'independent'
-                                                ("ind(i)", "ind(i+1)",
-                                                 "independent"),
-                                                # This returns a SymPy Image
-                                                # object:
-                                                ("EXP(i)", "1",
-                                                 "independent"),
-                                                # This returns a SymPy Union
-                                                ("i*(exp(i)-i)", "0",
-                                                 "independent"),
-                                                ("i*i", "2*i-1", set([1])),
-                                                ("i*i", "4", set([2, -2])),
-                                                ("2*i", "2*i+1", set()),
-                                                ])
-def test_symbolic_math_solve(fortran_reader, exp1, exp2, result):
+SOLVE_EXPRESSIONS = [("i", "2*i+1", set([-1])),
+                     # Infinite solutions (i is any
+                     # integer) are returned as
+                     # string "independent"
+                     ("i", "i", "independent"),
+                     # Indirect addressing cannot be
+                     # resolved, sympy returns a
+                     # ConditionSet, which must be
+                     # returned as 'independent'
+                     ("ind(i)", "ind(i+1)",
+                      "independent"),
+                     # This returns a SymPy Image
+                     # object:
+                     ("EXP(i)", "1",
+                      "independent"),
+                     # This returns a SymPy Union
+                     ("i*(exp(i)-i)", "0",
+                      "independent"),
+                     ("i*i", "2*i-1", set([1])),
+                     ("i*i", "4", set([2, -2])),
+                     ("2*i", "2*i+1", set()),
+                     ]
+
+
+@pytest.mark.parametrize("exp1, exp2, result", SOLVE_EXPRESSIONS)
+def test_symbolic_math_solve(sym_maths, exp1, exp2, result):
     '''Test that the sympy based comparison handles complex
     expressions that are not equal.
 
     '''
-    # A dummy program to easily create the PSyIR for the
-    # expressions we need. We just take the RHS of the assignments
-    source = f'''program test_prog
-                use some_mod
-                integer :: i, j, k, x, ind(10)
-                type(my_mod_type) :: a, b
-                x = {exp1}
-                x = {exp2}
-                end program test_prog
-                '''
-    psyir = fortran_reader.psyir_from_source(source)
-    schedule = psyir.children[0]
-
-    sym_maths = SymbolicMaths.get()
+    rhs1, rhs2 = _get_rhs_pair("""integer :: i, j, k, x, ind(10)
+                type(my_mod_type) :: a, b""",
+                               SOLVE_EXPRESSIONS, exp1, exp2)
     writer = SymPyWriter()
-    sympy_expressions = writer([schedule[0].rhs, schedule[1].rhs])
+    sympy_expressions = writer([rhs1, rhs2])
     symbol_map = writer.type_map
     # Get the symbol used for 'i', so we can solve for 'i'
     i = symbol_map["i"]
@@ -310,10 +351,8 @@ def test_symbolic_math_solve(fortran_reader, exp1, exp2, result):
     assert solution == result
 
 
-def test_solve_equal_for_error(monkeypatch):
+def test_solve_equal_for_error(sym_maths, monkeypatch):
     '''Test that an unexpected SymPy result type raises the expected error. '''
-
-    sym_maths = SymbolicMaths.get()
     # Monkeypatch SymPy's solveset to return a plain Python integer:
     monkeypatch.setattr(solvers, "solveset", lambda _x, _y: 1)
     x_sym = Symbol("X")
@@ -322,107 +361,84 @@ def test_solve_equal_for_error(monkeypatch):
     assert "Unexpected solution '1'' of type '<class 'int'>'" in str(err.value)
 
 
-@pytest.mark.parametrize("expressions", [("max(3, 2, 1)", "max(1, 2, 3)"),
-                                         ("max(1, 3)", "3"),
-                                         ("max(1, 3)", "max(1, 2, 3)"),
-                                         ("min(3, 2, 1)", "min(1, 2, 3)"),
-                                         ("min(1, 3)", "min(1, 2, 3)"),
-                                         ("min(1, 2, 3)", "1"),
-                                         ("MOD(7,2)", "1"),
-                                         ("MOD(i,j)", "mod(2+i-2, j)"),
-                                         ("FLOOR(1.1)", "1"),
-                                         ("FLOOR(-1.1)", "-2")
-                                         ])
-def test_symbolic_math_functions_with_constants(fortran_reader, expressions):
+FUNCTION_EXPRESSIONS = [("max(3, 2, 1)", "max(1, 2, 3)"),
+                        ("max(1, 3)", "3"),
+                        ("max(1, 3)", "max(1, 2, 3)"),
+                        ("min(3, 2, 1)", "min(1, 2, 3)"),
+                        ("min(1, 3)", "min(1, 2, 3)"),
+                        ("min(1, 2, 3)", "1"),
+                        ("MOD(7,2)", "1"),
+                        ("MOD(i,j)", "mod(2+i-2, j)"),
+                        ("FLOOR(1.1)", "1"),
+                        ("FLOOR(-1.1)", "-2")
+                        ]
+
+
+@pytest.mark.parametrize("expressions", FUNCTION_EXPRESSIONS)
+def test_symbolic_math_functions_with_constants(sym_maths, expressions):
     '''Test that recognised functions with constant values as arguments are
     handled correctly."
 
     '''
-    # A dummy program to easily create the PSyIR for the
-    # expressions we need. We just take the RHS of the assignments
-    source = f'''program test_prog
-                 use some_mod
-                 integer :: i, j, k, x
-                 type(my_mod_type) :: a, b
-                 x = {expressions[0]}
-                 x = {expressions[1]}
-                 end program test_prog
-             '''
+    rhs1, rhs2 = _get_rhs_pair(DECLARATIONS, FUNCTION_EXPRESSIONS,
+                               *expressions)
+    assert sym_maths.equal(rhs1, rhs2) is True
 
-    psyir = fortran_reader.psyir_from_source(source)
-    schedule = psyir.children[0]
-    sym_maths = SymbolicMaths.get()
-    assert sym_maths.equal(schedule[0].rhs, schedule[1].rhs) is True
+
+RESERVED_NAME_EXPRESSIONS = [("field(1+i)", "field(i+1)"),
+                             ("lambda", "lambda+0"),
+                             ("lambda(1+i)", "lambda(i+1)"),
+                             ("a%field(b+1)", "a%field(1+b)"),
+                             ("a%b%c(a_b+1)", "a%b%c(1+a_b)"),
+                             ("a%field(field+1)",
+                              "a%field(1+field)"),
+                             ("b+a%b(a%c,a%c,a%c)",
+                              "a%b(a%c,a%c,a%c)+b")
+                             ]
 
 
-@pytest.mark.parametrize("expressions", [("field(1+i)", "field(i+1)"),
-                                         ("lambda", "lambda"),
-                                         ("lambda(1+i)", "lambda(i+1)"),
-                                         ("a%field(b+1)", "a%field(1+b)"),
-                                         ("a%b%c(a_b+1)", "a%b%c(1+a_b)"),
-                                         ("a%field(field+1)",
-                                          "a%field(1+field)"),
-                                         ("b+a%b(a%c,a%c,a%c)",
-                                          "b+a%b(a%c,a%c,a%c)")
-                                         ])
-def test_symbolic_math_use_reserved_names(fortran_reader, expressions):
+@pytest.mark.parametrize("expressions", RESERVED_NAME_EXPRESSIONS)
+def test_symbolic_math_use_reserved_names(sym_maths, expressions):
     '''Test that reserved names are handled as expected. The SymPy parser
     uses 'eval' internally, so if a Fortran variable name should be the
     same as a SymPy function (e.g. 'field'), parsing will fail. Similarly,
     a Python reserved name (like 'lambda') would cause a parsing error.
 
     '''
-    # A dummy program to easily create the PSyIR for the
-    # expressions we need. We just take the RHS of the assignments
-    source = f'''program test_prog
-                 use some_mod
-                 integer :: field(10)
-                 integer :: i, x
-                 type(my_mod_type) :: a, b
-                 x = {expressions[0]}
-                 x = {expressions[1]}
-                 end program test_prog
-             '''
-    psyir = fortran_reader.psyir_from_source(source)
-    schedule = psyir.children[0]
-    sym_maths = SymbolicMaths.get()
-    assert sym_maths.equal(schedule[0].rhs, schedule[1].rhs) is True
-
-
-@pytest.mark.parametrize("expressions", [("field(:)", "field(::)", True),
-                                         ("field(1:2:3)",
-                                          "field(1:2:3)", True),
-                                         ("field(1:2:1)",
-                                          "field(1:2)", True),
-                                         ("field(1:2:3)",
-                                          "field(2:2:3)", False),
-                                         ("field(1:2:3)",
-                                          "field(1:3:3)", False),
-                                         ("field(1:2:3)",
-                                          "field(1:2:4)", False),
-                                         ])
-def test_symbolic_math_use_range(fortran_reader, expressions):
+    rhs1, rhs2 = _get_rhs_pair("""integer :: field(10)
+                integer :: i, x
+                type(my_mod_type) :: a, b""",
+                               RESERVED_NAME_EXPRESSIONS, *expressions)
+    assert sym_maths.equal(rhs1, rhs2) is True
+
+
+RANGE_EXPRESSIONS = [("field(:)", "field(::)", True),
+                     ("field(1:2:3)",
+                      "field(1:2:3)", True),
+                     ("field(1:2:1)",
+                      "field(1:2)", True),
+                     ("field(1:2:3)",
+                      "field(2:2:3)", False),
+                     ("field(1:2:3)",
+                      "field(1:3:3)", False),
+                     ("field(1:2:3)",
+                      "field(1:2:4)", False),
+                     ]
+
+
+@pytest.mark.parametrize("expressions", RANGE_EXPRESSIONS)
+def test_symbolic_math_use_range(sym_maths, expressions):
     '''Test that ranges are handled correctly. A `Range` is converted
     to a SymPy three-tuple (start, stop, step), which means all components
     need to be handled individually
 
     '''
-    # A dummy program to easily create the PSyIR for the
-    # expressions we need. We just take the RHS of the assignments
-    source = f'''program test_prog
-                 use some_mod
-                 integer :: field(10), i
-                 type(my_mod_type) :: a, b
-                 x = {expressions[0]}
-                 x = {expressions[1]}
-                 end program test_prog
-             '''
-    psyir = fortran_reader.psyir_from_source(source)
-    schedule = psyir.children[0]
-    sym_maths = SymbolicMaths.get()
+    rhs1, rhs2 = _get_rhs_pair("""integer :: field(10), i
+                type(my_mod_type) :: a, b""",
+                               RANGE_EXPRESSIONS, *expressions[:2])
     # The child of the ArrayReference is the Range
-    assert sym_maths.equal(schedule[0].rhs.children[0],
-                           schedule[1].rhs.children[0]) is expressions[2]
+    assert sym_maths.equal(rhs1.children[0],
+                           rhs2.children[0]) is expressions[2]
 
 
 @pytest.mark.parametrize("expr,expected", [
@@ -436,23 +452,19 @@ def test_symbolic_math_use_range(fortran_reader, expressions):
     ("a*((b+c)/d)", "a * b / d + a * c / d"),
     ("a(i)*((b(i,j)+c(j))/d)",
      "a(i) * b(i,j) / d + a(i) * c(j) / d")])
-def test_symbolic_maths_expand(fortran_reader, fortran_writer, expr, expected):
+def test_symbolic_maths_expand(sym_maths, fortran_reader, fortran_writer,
+                               expr, expected):
     '''Test the expand method works as expected.'''
     # A dummy program to easily create the PSyIR for the
     # expression we need. We just take the RHS of the assignment
-    source = (
-        f"program test_prog\n"
-        f"  use some_mod\n"
-        f"  x = {expr}\n"
-        f"end program test_prog\n")
+    source = f"{_PROG_PREFIX}x = {expr}\n{_PROG_SUFFIX}"
     psyir = fortran_reader.psyir_from_source(source)
-    sym_maths = SymbolicMaths.get()
     sym_maths.expand(psyir.children[0][0].rhs)
     result = fortran_writer(psyir.children[0][0].rhs)
     assert result == expected
 
 
-def test_symbolic_maths_array_and_array_index(fortran_reader):
+def test_symbolic_maths_array_and_array_index(sym_maths, fortran_reader):
     '''Test having an expression that uses a whole array and
     the same array with an index, e.g. : `a(i) + a`.
     '''
@@ -463,7 +475,6 @@ def test_symbolic_maths_array_and_array_index(fortran_reader):
           y = a
         end program test_prog'''
     psyir = fortran_reader.psyir_from_source(source)
-    sym_maths = SymbolicMaths.get()
     assert not sym_maths.equal(psyir.children[0][0].rhs,
                                psyir.children[0][1].rhs)
 
@@ -87,6 +87,30 @@ def test_variables_access_info():
                                 "read_written: READ+WRITE, written: READ+WRITE"
 
 
+# -----------------------------------------------------------------------------
+def test_variables_access_info_written_signatures():
+    '''Test that the set of written signatures is maintained when adding
+    accesses and when merging VariablesAccessInfo instances.
+    '''
+    var_accesses = VariablesAccessInfo()
+    node = Node()
+    assert var_accesses.written_signatures == set()
+    assert isinstance(var_accesses.written_signatures, frozenset)
+    var_accesses.add_access(Signature("read"), AccessType.READ, node)
+    var_accesses.add_access(Signature("written"), AccessType.WRITE, node)
+    var_accesses.add_access(Signature("inc"), AccessType.INC, node)
+    assert var_accesses.written_signatures == {Signature("written"),
+                                               Signature("inc")}
+
+    var_accesses2 = VariablesAccessInfo()
+    var_accesses2.add_access(Signature("read"), AccessType.READWRITE, node)
+    var_accesses2.add_access(Signature("new_read"), AccessType.READ, node)
+    var_accesses.merge(var_accesses2)
+    assert var_accesses.written_signatures == {Signature("written"),
+                                               Signature("inc"),
+                                               Signature("read")}
+
+
 # -----------------------------------------------------------------------------
 def test_variables_access_info_errors():
     '''Tests if errors are handled correctly. '''
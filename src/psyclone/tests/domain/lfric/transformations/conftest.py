@@ -0,0 +1,104 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2024, Science and Technology Facilities Council.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# -----------------------------------------------------------------------------
+
+''' Module containing pytest fixtures for the LFRic transformation tests. '''
+
+import pytest
+
+from psyclone.domain.lfric.transformations import LFRicExtractTrans
+from psyclone.transformations import (Dynamo0p3ColourTrans,
+                                      DynamoOMPParallelLoopTrans)
+
+
+@pytest.fixture(name="single_invoke_psy")
+def fixture_single_invoke_psy(get_lfric_invoke):
+    '''
+    :returns: a new PSy object and the first invoke of
+        ``1_single_invoke.f90``, without distributed memory.
+    :rtype: Tuple[:py:class:`psyclone.psyGen.PSy`,
+                  :py:class:`psyclone.psyGen.Invoke`]
+    '''
+    return get_lfric_invoke("1_single_invoke.f90")
+
+
+@pytest.fixture(name="builtin_and_normal_psy")
+def fixture_builtin_and_normal_psy(get_lfric_invoke):
+    '''
+    :returns: a new PSy object and the first invoke of
+        ``15.1.2_builtin_and_normal_kernel_invoke.f90``, without
+        distributed memory.
+    :rtype: Tuple[:py:class:`psyclone.psyGen.PSy`,
+                  :py:class:`psyclone.psyGen.Invoke`]
+    '''
+    return get_lfric_invoke("15.1.2_builtin_and_normal_kernel_invoke.f90")
+
+
+@pytest.fixture(name="multikernel_7_psy")
+def fixture_multikernel_7_psy(get_lfric_invoke):
+    '''
+    :returns: a new PSy object and the first invoke of
+        ``4.8_multikernel_invokes.f90``, without distributed memory.
+    :rtype: Tuple[:py:class:`psyclone.psyGen.PSy`,
+                  :py:class:`psyclone.psyGen.Invoke`]
+    '''
+    return get_lfric_invoke("4.8_multikernel_invokes.f90")
+
+
+@pytest.fixture(name="etrans", scope="session")
+def fixture_etrans():
+    '''
+    :returns: an LFRicExtractTrans instance shared by all tests. It has no
+        state that is modified when it is applied.
+    :rtype: :py:class:`psyclone.domain.lfric.transformations.LFRicExtractTrans`
+    '''
+    return LFRicExtractTrans()
+
+
+@pytest.fixture(name="ctrans", scope="session")
+def fixture_ctrans():
+    '''
+    :returns: a Dynamo0p3ColourTrans instance shared by all tests.
+    :rtype: :py:class:`psyclone.transformations.Dynamo0p3ColourTrans`
+    '''
+    return Dynamo0p3ColourTrans()
+
+
+@pytest.fixture(name="otrans", scope="session")
+def fixture_otrans():
+    '''
+    :returns: a DynamoOMPParallelLoopTrans instance shared by all tests.
+        Tests must not change its OpenMP schedule.
+    :rtype: :py:class:`psyclone.transformations.DynamoOMPParallelLoopTrans`
+    '''
+    return DynamoOMPParallelLoopTrans()
@@ -43,18 +43,10 @@ transformations and ExtractNode.
 
 import pytest
 
-from psyclone.configuration import Config
-from psyclone.domain.lfric.transformations import LFRicExtractTrans
 from psyclone.domain.lfric import LFRicConstants
 from psyclone.psyir.nodes import colored, ExtractNode, Loop
 from psyclone.psyir.transformations import PSyDataTrans, TransformationError
 from psyclone.tests.lfric_build import LFRicBuild
-from psyclone.tests.utilities import get_invoke
-from psyclone.transformations import (Dynamo0p3ColourTrans,
-                                      DynamoOMPParallelLoopTrans)
-
-# API names
-DYNAMO_API = "lfric"
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -73,16 +65,14 @@ def clear_region_name_cache():
 # --------------------------------------------------------------------------- #
 
 
-def test_node_list_error(tmpdir):
+def test_node_list_error(tmpdir, get_lfric_invoke, etrans):
     ''' Test that applying Extract Transformation on objects which are not
     Nodes or a list of Nodes raises a TransformationError. Also raise
     transformation errors when the Nodes do not have the same parent
     if they are incorrectly ordered. '''
-    etrans = LFRicExtractTrans()
 
     # First test for f1 readwrite to read dependency
-    psy, _ = get_invoke("3.2_multi_functions_multi_named_invokes.f90",
-                        DYNAMO_API, idx=0, dist_mem=False)
+    psy, _ = get_lfric_invoke("3.2_multi_functions_multi_named_invokes.f90")
     invoke0 = psy.invokes.invoke_list[0]
     invoke1 = psy.invokes.invoke_list[1]
     # Supply an object which is not a Node or a list of Nodes
@@ -94,16 +84,21 @@ def test_node_list_error(tmpdir):
             "<class 'psyclone.domain.lfric.lfric_invoke.LFRicInvoke'>"
             in str(excinfo.value))
 
+    # The same error must be raised when only validating
+    with pytest.raises(TransformationError) as excinfo:
+        etrans.validate(invoke0)
+    assert ("Error in LFRicExtractTrans: Argument must be a single Node in "
+            "a Schedule" in str(excinfo.value))
+
     # Supply Nodes in incorrect order or duplicate Nodes
     node_list = [invoke0.schedule.children[0],
                  invoke0.schedule.children[0],
                  invoke0.schedule.children[1]]
     with pytest.raises(TransformationError) as excinfo:
         etrans.apply(node_list)
-    assert "Children are not consecutive children of one parent:" \
-           in str(excinfo.value)
-    assert "has position 0, but previous child had position 0."\
-        in str(excinfo.value)
+    msg = str(excinfo.value)
+    assert "Children are not consecutive children of one parent:" in msg
+    assert "has position 0, but previous child had position 0." in msg
 
     # Supply Nodes which are not children of the same parent
     node_list = [invoke0.schedule.children[1],
@@ -117,14 +112,12 @@ def test_node_list_error(tmpdir):
     assert LFRicBuild(tmpdir).code_compiles(psy)
 
 
-def test_distmem_error(monkeypatch):
+def test_distmem_error(monkeypatch, config_instance, get_lfric_invoke, etrans):
     ''' Test that applying ExtractRegionTrans with distributed memory
     enabled raises a TransformationError. '''
-    etrans = LFRicExtractTrans()
 
     # Test Dynamo0.3 API with distributed memory
-    _, invoke = get_invoke("1_single_invoke.f90", DYNAMO_API,
-                           idx=0, dist_mem=True)
+    _, invoke = get_lfric_invoke("1_single_invoke.f90", dist_mem=True)
     schedule = invoke.schedule
     # Try applying Extract transformation
     with pytest.raises(TransformationError) as excinfo:
@@ -135,8 +128,7 @@ def test_distmem_error(monkeypatch):
     # Try applying Extract transformation to Node(s) containing HaloExchange
     # We have to disable distributed memory, otherwise an earlier test
     # will be triggered
-    config = Config.get()
-    monkeypatch.setattr(config, "distributed_memory", False)
+    monkeypatch.setattr(config_instance, "distributed_memory", False)
     with pytest.raises(TransformationError) as excinfo:
         etrans.apply(schedule.children[2:4])
     assert ("Nodes of type 'LFRicHaloExchange' cannot be enclosed by a "
@@ -144,14 +136,14 @@ def test_distmem_error(monkeypatch):
 
     # Try applying Extract transformation to Node(s) containing GlobalSum
     # This will set config.distributed_mem to True again.
-    _, invoke = get_invoke("15.14.3_sum_setval_field_builtin.f90",
-                           DYNAMO_API, idx=0, dist_mem=True)
+    _, invoke = get_lfric_invoke("15.14.3_sum_setval_field_builtin.f90",
+                                 dist_mem=True)
     schedule = invoke.schedule
     glob_sum = schedule.children[2]
 
-    # We have to disable distributed memory again (get_invoke before
+    # We have to disable distributed memory again (get_lfric_invoke before
     # will set it to true), otherwise an earlier test will be triggered
-    monkeypatch.setattr(config, "distributed_memory", False)
+    monkeypatch.setattr(config_instance, "distributed_memory", False)
     with pytest.raises(TransformationError) as excinfo:
         etrans.apply(glob_sum)
 
@@ -159,14 +151,12 @@ def test_distmem_error(monkeypatch):
             "LFRicExtractTrans transformation") in str(excinfo.value)
 
 
-def test_repeat_extract():
+def test_repeat_extract(single_invoke_psy, etrans):
     ''' Test that applying Extract Transformation on Node(s) already
     containing an ExtractNode raises a TransformationError. '''
-    etrans = LFRicExtractTrans()
 
     # Test Dynamo0.3 API
-    _, invoke = get_invoke("1_single_invoke.f90", DYNAMO_API,
-                           idx=0, dist_mem=False)
+    _, invoke = single_invoke_psy
     schedule = invoke.schedule
     # Apply Extract transformation
     etrans.apply(schedule.children[0])
@@ -177,36 +167,31 @@ def test_repeat_extract():
             "LFRicExtractTrans transformation") in str(excinfo.value)
 
 
-def test_kern_builtin_no_loop():
+def test_kern_builtin_no_loop(builtin_and_normal_psy, etrans):
     ''' Test that applying Extract Transformation on a Kernel or Built-in
     call without its parent Loop raises a TransformationError. '''
 
     # Test Dynamo0.3 API for Built-in call error
-    dynetrans = LFRicExtractTrans()
-    _, invoke = get_invoke("15.1.2_builtin_and_normal_kernel_invoke.f90",
-                           DYNAMO_API, idx=0, dist_mem=False)
+    _, invoke = builtin_and_normal_psy
     schedule = invoke.schedule
     # Test Built-in call
     builtin_call = schedule.children[1].loop_body[0]
     with pytest.raises(TransformationError) as excinfo:
-        dynetrans.apply(builtin_call)
+        etrans.apply(builtin_call)
     assert "Error in LFRicExtractTrans: Application to a Kernel or a " \
            "Built-in call without its parent Loop is not allowed." \
            in str(excinfo.value)
 
 
-def test_loop_no_directive_dynamo0p3():
+def test_loop_no_directive_dynamo0p3(get_lfric_invoke, etrans, otrans):
     ''' Test that applying Extract Transformation on a Loop without its
     parent Directive when optimisations are applied in Dynamo0.3 API
     raises a TransformationError. '''
-    etrans = LFRicExtractTrans()
 
     # Test a Loop nested within the OMP Parallel DO Directive
-    _, invoke = get_invoke("4.13_multikernel_invokes_w3_anyd.f90",
-                           DYNAMO_API, idx=0, dist_mem=False)
+    _, invoke = get_lfric_invoke("4.13_multikernel_invokes_w3_anyd.f90")
     schedule = invoke.schedule
     # Apply DynamoOMPParallelLoopTrans to the second Loop
-    otrans = DynamoOMPParallelLoopTrans()
     otrans.apply(schedule[1])
     loop = schedule.children[1].dir_body[0]
     # Try extracting the Loop inside the OMP Parallel DO region
@@ -216,17 +201,12 @@ def test_loop_no_directive_dynamo0p3():
            "parent Directive is not allowed." in str(excinfo.value)
 
 
-def test_no_colours_loop_dynamo0p3():
+def test_no_colours_loop_dynamo0p3(single_invoke_psy, etrans, ctrans, otrans):
     ''' Test that applying LFRicExtractTrans on a Loop over cells
     in a colour without its parent Loop over colours in Dynamo0.3 API
     raises a TransformationError. '''
 
-    etrans = LFRicExtractTrans()
-    ctrans = Dynamo0p3ColourTrans()
-    otrans = DynamoOMPParallelLoopTrans()
-
-    _, invoke = get_invoke("1_single_invoke.f90", DYNAMO_API,
-                           idx=0, dist_mem=False)
+    _, invoke = single_invoke_psy
     schedule = invoke.schedule
 
     # Colour first loop that calls testkern_code (loop is over cells and
@@ -249,15 +229,13 @@ def test_no_colours_loop_dynamo0p3():
 # --------------------------------------------------------------------------- #
 
 
-def test_extract_node_position():
+def test_extract_node_position(builtin_and_normal_psy, etrans):
     ''' Test that Extract Transformation inserts the ExtractNode
     at the position of the first Node a Schedule in the Node list
     marked for extraction. '''
 
     # Test Dynamo0.3 API for extraction of a list of Nodes
-    dynetrans = LFRicExtractTrans()
-    _, invoke = get_invoke("15.1.2_builtin_and_normal_kernel_invoke.f90",
-                           DYNAMO_API, idx=0, dist_mem=False)
+    _, invoke = builtin_and_normal_psy
     schedule = invoke.schedule
     # Apply Extract transformation to the first three Nodes and assert that
     # position and the absolute position of the ExtractNode are the same as
@@ -266,21 +244,20 @@ def test_extract_node_position():
     children = schedule.children[pos:pos+3]
     abspos = children[0].abs_position
     dpth = children[0].depth
-    dynetrans.apply(children)
-    extract_node = schedule.walk(ExtractNode)
-    # The result is only one ExtractNode in the list with position 0
-    assert extract_node[0].position == pos
-    assert extract_node[0].abs_position == abspos
-    assert extract_node[0].depth == dpth
+    etrans.apply(children)
+    # The ExtractNode replaces the first of the extracted nodes
+    extract_node = schedule.children[pos]
+    assert isinstance(extract_node, ExtractNode)
+    assert extract_node.position == pos
+    assert extract_node.abs_position == abspos
+    assert extract_node.depth == dpth
 
 
-def test_extract_node_representation():
+def test_extract_node_representation(multikernel_7_psy, etrans):
     ''' Test that representation properties and methods of the ExtractNode
     class: view  and __str__ produce the correct results. '''
 
-    etrans = LFRicExtractTrans()
-    _, invoke = get_invoke("4.8_multikernel_invokes.f90", DYNAMO_API,
-                           idx=0, dist_mem=False)
+    _, invoke = multikernel_7_psy
     schedule = invoke.schedule
     children = schedule.children[1:3]
     etrans.apply(children)
@@ -291,32 +268,24 @@ def test_extract_node_representation():
     assert expected_output in output
 
     # Test __str__ method
-
+    schedule_str = str(schedule)
     assert "End LFRicLoop\nExtractStart[var=extract_psy_data]\nLFRicLoop[" \
-        in str(schedule)
+        in schedule_str
     assert "End LFRicLoop\nExtractEnd[var=extract_psy_data]\nLFRicLoop[" in \
-        str(schedule)
-    # Count the loops inside and outside the extract to check it is in
+        schedule_str
+    # Check the loops inside and outside the extract to check it is in
     # the right place
-    [before, after] = str(schedule).split("ExtractStart")
-    [inside, after] = after.split("ExtractEnd")
-    assert before.count("Loop[") == 1
-    assert inside.count("Loop[") == 2
-    assert after.count("Loop[") == 2
-
-
-def test_single_node_dynamo0p3():
-    ''' Test that Extract Transformation on a single Node in a Schedule
-    produces the correct result in Dynamo0.3 API. '''
-    etrans = LFRicExtractTrans()
+    extract_node = schedule.children[1]
+    assert isinstance(extract_node, ExtractNode)
+    assert len(schedule.children) == 4
+    assert isinstance(schedule.children[0], Loop)
+    inside = extract_node.psy_data_body.children
+    assert len(inside) == 2
+    assert all(isinstance(node, Loop) for node in inside)
+    assert all(isinstance(node, Loop) for node in schedule.children[2:])
 
-    psy, invoke = get_invoke("1_single_invoke.f90", DYNAMO_API,
-                             idx=0, dist_mem=False)
-    schedule = invoke.schedule
 
-    etrans.apply(schedule.children[0])
-    code = str(psy.gen)
-    output = '''      ! ExtractStart
+SINGLE_NODE_OUTPUT = '''      ! ExtractStart
       !
       CALL extract_psy_data%PreStart("single_invoke_psy", \
 "invoke_0_testkern_type:testkern_code:r0", 17, 2)
@@ -370,22 +339,9 @@ def test_single_node_dynamo0p3():
       CALL extract_psy_data%PostEnd
       !
       ! ExtractEnd'''
-    assert output in code
 
 
-def test_node_list_dynamo0p3():
-    ''' Test that applying Extract Transformation on a list of Nodes
-    produces the correct result in the Dynamo0.3 API.
-
-    '''
-    etrans = LFRicExtractTrans()
-    psy, invoke = get_invoke("15.1.2_builtin_and_normal_kernel_invoke.f90",
-                             DYNAMO_API, idx=0, dist_mem=False)
-    schedule = invoke.schedule
-
-    etrans.apply(schedule.children[0:3])
-    code = str(psy.gen)
-    output = """! ExtractStart
+NODE_LIST_OUTPUT = """! ExtractStart
       !
       CALL extract_psy_data%PreStart("single_invoke_builtin_then_kernel_psy", \
 "invoke_0:r0", 11, 5)
@@ -440,23 +396,9 @@ def test_node_list_dynamo0p3():
       !
       ! ExtractEnd"""
 
-    assert output in code
-
 
-def test_dynamo0p3_builtin():
-    ''' Tests the handling of builtins.
-
-    '''
-    etrans = LFRicExtractTrans()
-    psy, invoke = get_invoke("15.1.2_builtin_and_normal_kernel_invoke.f90",
-                             DYNAMO_API, idx=0, dist_mem=False)
-    schedule = invoke.schedule
-
-    etrans.apply(schedule.children[0:3])
-    code = str(psy.gen)
-
-    output = """CALL extract_psy_data%PreDeclareVariable("loop1_start", """\
-             """loop1_start)
+BUILTIN_OUTPUT = """CALL extract_psy_data%PreDeclareVariable(""" \
+    """"loop1_start", loop1_start)
       CALL extract_psy_data%PreDeclareVariable("loop1_stop", loop1_stop)
       CALL extract_psy_data%PreDeclareVariable("loop2_start", loop2_start)
       CALL extract_psy_data%PreDeclareVariable("loop2_stop", loop2_stop)
@@ -503,25 +445,9 @@ def test_dynamo0p3_builtin():
       CALL extract_psy_data%PostEnd
       !
       ! ExtractEnd"""
-    assert output in code
-
-
-def test_extract_single_builtin_dynamo0p3():
-    ''' Test that extraction of a BuiltIn in an Invoke produces the
-    correct result in Dynamo0.3 API without and with optimisations.
 
-    '''
-    etrans = LFRicExtractTrans()
-
-    otrans = DynamoOMPParallelLoopTrans()
 
-    psy, invoke = get_invoke("15.1.2_builtin_and_normal_kernel_invoke.f90",
-                             DYNAMO_API, idx=0, dist_mem=False)
-    schedule = invoke.schedule
-
-    etrans.apply(schedule.children[1])
-    code = str(psy.gen)
-    output = """! ExtractStart
+SINGLE_BUILTIN_OUTPUT = """! ExtractStart
       !
       CALL extract_psy_data%PreStart("single_invoke_builtin_then_kernel_psy", """ \
       """"invoke_0:setval_c:r0", 2, 2)
@@ -543,62 +469,9 @@ def test_extract_single_builtin_dynamo0p3():
       CALL extract_psy_data%PostEnd
       !
       ! ExtractEnd"""
-    assert output in code
-
-    # Test extract with OMP Parallel optimisation
-    psy, invoke = get_invoke("15.1.1_builtin_and_normal_kernel_invoke_2.f90",
-                             DYNAMO_API, idx=0, dist_mem=False)
-    schedule = invoke.schedule
-
-    otrans.apply(schedule.children[1])
-    etrans.apply(schedule.children[1])
-    code_omp = str(psy.gen)
-    output = """
-      ! ExtractStart
-      !
-      CALL extract_psy_data%PreStart("single_invoke_psy", """ \
-      """"invoke_0:inc_ax_plus_y:r0", 4, 2)
-      CALL extract_psy_data%PreDeclareVariable("f1_data", f1_data)
-      CALL extract_psy_data%PreDeclareVariable("f2_data", f2_data)
-      CALL extract_psy_data%PreDeclareVariable("loop1_start", loop1_start)
-      CALL extract_psy_data%PreDeclareVariable("loop1_stop", loop1_stop)
-      CALL extract_psy_data%PreDeclareVariable("df_post", df)
-      CALL extract_psy_data%PreDeclareVariable("f1_data_post", f1_data)
-      CALL extract_psy_data%PreEndDeclaration
-      CALL extract_psy_data%ProvideVariable("f1_data", f1_data)
-      CALL extract_psy_data%ProvideVariable("f2_data", f2_data)
-      CALL extract_psy_data%ProvideVariable("loop1_start", loop1_start)
-      CALL extract_psy_data%ProvideVariable("loop1_stop", loop1_stop)
-      CALL extract_psy_data%PreEnd
-      !$omp parallel do default(shared), private(df), schedule(static)
-      DO df = loop1_start, loop1_stop, 1
-        ! Built-in: inc_aX_plus_Y (real-valued fields)
-        f1_data(df) = 0.5_r_def * f1_data(df) + f2_data(df)
-      END DO
-      !$omp end parallel do
-      CALL extract_psy_data%PostStart
-      CALL extract_psy_data%ProvideVariable("df_post", df)
-      CALL extract_psy_data%ProvideVariable("f1_data_post", f1_data)
-      CALL extract_psy_data%PostEnd
-      !
-      ! ExtractEnd"""
-    assert output in code_omp
-
-
-def test_extract_kernel_and_builtin_dynamo0p3():
-    ''' Test that extraction of a Kernel and a BuiltIny in an Invoke
-    produces the correct result in Dynamo0.3 API.
-
-    '''
-    etrans = LFRicExtractTrans()
 
-    psy, invoke = get_invoke("15.1.2_builtin_and_normal_kernel_invoke.f90",
-                             DYNAMO_API, idx=0, dist_mem=False)
-    schedule = invoke.schedule
 
-    etrans.apply(schedule.children[1:3])
-    code = str(psy.gen)
-    output = """
+KERNEL_AND_BUILTIN_OUTPUT = """
       ! ExtractStart
       !
       CALL extract_psy_data%PreStart("single_invoke_builtin_then_kernel_psy", """ \
@@ -644,52 +517,89 @@ def test_extract_kernel_and_builtin_dynamo0p3():
       !
       ! ExtractEnd"""
 
-    assert output in code
+
+@pytest.mark.parametrize("algfile, start, stop, expected", [
+    ("1_single_invoke.f90", 0, 1, [SINGLE_NODE_OUTPUT]),
+    ("15.1.2_builtin_and_normal_kernel_invoke.f90", 0, 3,
+     [NODE_LIST_OUTPUT, BUILTIN_OUTPUT]),
+    ("15.1.2_builtin_and_normal_kernel_invoke.f90", 1, 2,
+     [SINGLE_BUILTIN_OUTPUT]),
+    ("15.1.2_builtin_and_normal_kernel_invoke.f90", 1, 3,
+     [KERNEL_AND_BUILTIN_OUTPUT])],
+    ids=["single_node", "node_list", "single_builtin",
+         "kernel_and_builtin"])
+def test_extract_codegen_dynamo0p3(get_lfric_invoke, algfile, start, stop,
+                                   expected, etrans):
+    ''' Test that Extract Transformation on a single Node, a list of Nodes,
+    Kernels and BuiltIns in a Schedule produces the correct result in
+    Dynamo0.3 API.
+
+    '''
+    psy, invoke = get_lfric_invoke(algfile)
+    schedule = invoke.schedule
+
+    etrans.apply(schedule.children[start:stop])
+    code = str(psy.gen)
+    for fragment in expected:
+        assert fragment in code
 
     # TODO #706: Compilation for LFRic extraction not supported yet.
     # assert LFRicBuild(tmpdir).code_compiles(psy)
 
 
-def test_extract_colouring_omp_dynamo0p3():
-    ''' Test that extraction of a Kernel in an Invoke after applying
-    colouring and OpenMP optimisations produces the correct result
-    in Dynamo0.3 API. '''
+SINGLE_BUILTIN_OMP_OUTPUT = """
+      ! ExtractStart
+      !
+      CALL extract_psy_data%PreStart("single_invoke_psy", """ \
+      """"invoke_0:inc_ax_plus_y:r0", 4, 2)
+      CALL extract_psy_data%PreDeclareVariable("f1_data", f1_data)
+      CALL extract_psy_data%PreDeclareVariable("f2_data", f2_data)
+      CALL extract_psy_data%PreDeclareVariable("loop1_start", loop1_start)
+      CALL extract_psy_data%PreDeclareVariable("loop1_stop", loop1_stop)
+      CALL extract_psy_data%PreDeclareVariable("df_post", df)
+      CALL extract_psy_data%PreDeclareVariable("f1_data_post", f1_data)
+      CALL extract_psy_data%PreEndDeclaration
+      CALL extract_psy_data%ProvideVariable("f1_data", f1_data)
+      CALL extract_psy_data%ProvideVariable("f2_data", f2_data)
+      CALL extract_psy_data%ProvideVariable("loop1_start", loop1_start)
+      CALL extract_psy_data%ProvideVariable("loop1_stop", loop1_stop)
+      CALL extract_psy_data%PreEnd
+      !$omp parallel do default(shared), private(df), schedule(static)
+      DO df = loop1_start, loop1_stop, 1
+        ! Built-in: inc_aX_plus_Y (real-valued fields)
+        f1_data(df) = 0.5_r_def * f1_data(df) + f2_data(df)
+      END DO
+      !$omp end parallel do
+      CALL extract_psy_data%PostStart
+      CALL extract_psy_data%ProvideVariable("df_post", df)
+      CALL extract_psy_data%ProvideVariable("f1_data_post", f1_data)
+      CALL extract_psy_data%PostEnd
+      !
+      ! ExtractEnd"""
 
-    const = LFRicConstants()
-    etrans = LFRicExtractTrans()
-    ctrans = Dynamo0p3ColourTrans()
-    otrans = DynamoOMPParallelLoopTrans()
 
-    psy, invoke = get_invoke("4.8_multikernel_invokes.f90",
-                             DYNAMO_API, idx=0, dist_mem=False)
+def test_extract_single_builtin_omp_dynamo0p3(get_lfric_invoke, etrans,
+                                              otrans):
+    ''' Test that extraction of a BuiltIn in an Invoke produces the
+    correct result in Dynamo0.3 API with optimisations.
+
+    '''
+    psy, invoke = get_lfric_invoke(
+        "15.1.1_builtin_and_normal_kernel_invoke_2.f90")
     schedule = invoke.schedule
 
-    # First colour all of the loops over cells unless they are on
-    # discontinuous spaces
-    for child in schedule.children:
-        if isinstance(child, Loop) and child.field_space.orig_name \
-           not in const.VALID_DISCONTINUOUS_NAMES \
-           and child.iteration_space == "cell_column":
-            ctrans.apply(child)
-    # Then apply OpenMP to each of the colour loops
-    for child in schedule.children:
-        if isinstance(child, Loop):
-            if child.loop_type == "colours":
-                otrans.apply(child.loop_body[0])
-            else:
-                otrans.apply(child)
+    otrans.apply(schedule.children[1])
+    etrans.apply(schedule.children[1])
+    code_omp = str(psy.gen)
+    assert SINGLE_BUILTIN_OMP_OUTPUT in code_omp
 
-    # Extract the second instance of ru_kernel_type after colouring
-    # and OpenMP are applied
-    child = schedule.children[2]
-    etrans.apply(child)
 
-    code = str(psy.gen)
-    output = ("""
+COLOURING_OMP_OUTPUT = (
+    """
       ! ExtractStart
       !
       CALL extract_psy_data%PreStart("multikernel_invokes_7_psy", """
-              """"invoke_0:ru_code:r0", 30, 3)
+    """"invoke_0:ru_code:r0", 30, 3)
       CALL extract_psy_data%PreDeclareVariable("a_data", a_data)
       CALL extract_psy_data%PreDeclareVariable("b_data", b_data)
       CALL extract_psy_data%PreDeclareVariable("basis_w0_qr", basis_w0_qr)
@@ -698,9 +608,9 @@ def test_extract_colouring_omp_dynamo0p3():
       CALL extract_psy_data%PreDeclareVariable("c_data", c_data)
       CALL extract_psy_data%PreDeclareVariable("cmap", cmap)
       CALL extract_psy_data%PreDeclareVariable("diff_basis_w0_qr", """
-              """diff_basis_w0_qr)
+    """diff_basis_w0_qr)
       CALL extract_psy_data%PreDeclareVariable("diff_basis_w2_qr", """
-              """diff_basis_w2_qr)
+    """diff_basis_w2_qr)
       CALL extract_psy_data%PreDeclareVariable("e", e)
       CALL extract_psy_data%PreDeclareVariable("istp", istp)
       CALL extract_psy_data%PreDeclareVariable("last_edge_cell_all_colours", \
@@ -735,9 +645,9 @@ last_edge_cell_all_colours)
       CALL extract_psy_data%ProvideVariable("c_data", c_data)
       CALL extract_psy_data%ProvideVariable("cmap", cmap)
       CALL extract_psy_data%ProvideVariable("diff_basis_w0_qr", """
-              """diff_basis_w0_qr)
+    """diff_basis_w0_qr)
       CALL extract_psy_data%ProvideVariable("diff_basis_w2_qr", """
-              """diff_basis_w2_qr)
+    """diff_basis_w2_qr)
       CALL extract_psy_data%ProvideVariable("e", e)
       CALL extract_psy_data%ProvideVariable("istp", istp)
       CALL extract_psy_data%ProvideVariable("last_edge_cell_all_colours", \
@@ -765,13 +675,13 @@ last_edge_cell_all_colours)
         !$omp parallel do default(shared), private(cell), schedule(static)
         DO cell = loop5_start, last_edge_cell_all_colours(colour), 1
           CALL ru_code(nlayers, b_data, a_data, istp, rdt, """
-              "c_data, e_1_data, e_2_data, "
-              "e_3_data, ndf_w2, undf_w2, "
-              "map_w2(:,cmap(colour,cell)), "
-              "basis_w2_qr, diff_basis_w2_qr, ndf_w3, undf_w3, "
-              "map_w3(:,cmap(colour,cell)), basis_w3_qr, ndf_w0, undf_w0, "
-              "map_w0(:,cmap(colour,cell)), basis_w0_qr, diff_basis_w0_qr, "
-              """np_xy_qr, np_z_qr, weights_xy_qr, weights_z_qr)
+    "c_data, e_1_data, e_2_data, "
+    "e_3_data, ndf_w2, undf_w2, "
+    "map_w2(:,cmap(colour,cell)), "
+    "basis_w2_qr, diff_basis_w2_qr, ndf_w3, undf_w3, "
+    "map_w3(:,cmap(colour,cell)), basis_w3_qr, ndf_w0, undf_w0, "
+    "map_w0(:,cmap(colour,cell)), basis_w0_qr, diff_basis_w0_qr, "
+    """np_xy_qr, np_z_qr, weights_xy_qr, weights_z_qr)
         END DO
         !$omp end parallel do
       END DO
@@ -782,7 +692,43 @@ last_edge_cell_all_colours)
       CALL extract_psy_data%PostEnd
       !
       ! ExtractEnd""")
-    assert output in code
+
+
+def test_extract_colouring_omp_dynamo0p3(multikernel_7_psy, etrans, ctrans,
+                                         otrans):
+    ''' Test that extraction of a Kernel in an Invoke after applying
+    colouring and OpenMP optimisations produces the correct result
+    in Dynamo0.3 API. '''
+
+    const = LFRicConstants()
+    psy, invoke = multikernel_7_psy
+    schedule = invoke.schedule
+
+    # First colour all of the loops over cells unless they are on
+    # discontinuous spaces. The loops are collected before transforming
+    # them, since each transformation replaces a child of the schedule.
+    discontinuous_names = const.VALID_DISCONTINUOUS_NAMES
+    cell_loops = [child for child in schedule.children
+                  if isinstance(child, Loop) and
+                  child.field_space.orig_name not in discontinuous_names and
+                  child.iteration_space == "cell_column"]
+    for loop in cell_loops:
+        ctrans.apply(loop)
+    # Then apply OpenMP to each of the colour loops
+    loops = [child for child in schedule.children if isinstance(child, Loop)]
+    for loop in loops:
+        if loop.loop_type == "colours":
+            otrans.apply(loop.loop_body[0])
+        else:
+            otrans.apply(loop)
+
+    # Extract the second instance of ru_kernel_type after colouring
+    # and OpenMP are applied
+    child = schedule.children[2]
+    etrans.apply(child)
+
+    code = str(psy.gen)
+    assert COLOURING_OMP_OUTPUT in code
 
     # TODO #706: Compilation for LFRic extraction not supported yet.
     # assert LFRicBuild(tmpdir).code_compiles(psy)
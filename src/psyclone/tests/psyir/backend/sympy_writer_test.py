@@ -554,3 +554,54 @@ def test_sym_writer_reserved_names(fortran_reader, expression):
 
     sympy_exp = sympy_writer(psyir_expr)
     assert str(sympy_exp) == expression
+
+
+def test_sym_writer_reserved_names_table(fortran_reader):
+    '''Test that the shared symbol table with the reserved names is not
+    modified when converting expressions.
+    '''
+    source = '''program test_prog
+                use some_mod
+                integer :: x
+                x = lambda + i
+                end program test_prog '''
+    psyir = fortran_reader.psyir_from_source(source)
+    psyir_expr = psyir.children[0].children[0].rhs
+
+    sympy_writer = SymPyWriter()
+    # pylint: disable=protected-access
+    reserved_table = SymPyWriter._RESERVED_NAMES_TABLE
+    num_symbols = len(reserved_table.symbols)
+    assert sympy_writer._to_str(psyir_expr) == "lambda_1 + i"
+    assert SymPyWriter._RESERVED_NAMES_TABLE is reserved_table
+    assert len(reserved_table.symbols) == num_symbols
+    assert "i" not in reserved_table
+    # A second conversion must give the same names:
+    assert sympy_writer._to_str(psyir_expr) == "lambda_1 + i"
+
+
+def test_sym_writer_no_parsing(fortran_reader, monkeypatch):
+    '''Test that scalar references and integer constants are converted
+    without using the SymPy parser.
+    '''
+    source = '''program test_prog
+                use some_mod
+                integer :: x
+                x = i
+                x = 123_4
+                x = i + 1
+                end program test_prog '''
+    psyir = fortran_reader.psyir_from_source(source)
+    schedule = psyir.children[0]
+
+    def _raise(_expr, _type_map):
+        raise NotImplementedError("parse_expr must not be used")
+
+    monkeypatch.setattr("psyclone.psyir.backend.sympy_writer.parse_expr",
+                        _raise)
+    sympy_writer = SymPyWriter()
+    assert sympy_writer(schedule[0].rhs) == Symbol("i")
+    assert sympy_writer(schedule[1].rhs) == 123
+    # Any other expression still needs to be parsed:
+    with pytest.raises(NotImplementedError):
+        sympy_writer(schedule[2].rhs)
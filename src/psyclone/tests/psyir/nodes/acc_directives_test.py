@@ -39,14 +39,11 @@
 
 ''' Performs py.test tests on the OpenACC PSyIR Directive nodes. '''
 
-import os
 import pytest
 
 from psyclone.core import Signature
 from psyclone.errors import GenerationError
 from psyclone.f2pygen import ModuleGen
-from psyclone.parse.algorithm import parse
-from psyclone.psyGen import PSyFactory
 from psyclone.psyir.nodes import (ACCKernelsDirective,
                                   ACCLoopDirective,
                                   ACCParallelDirective,
@@ -67,9 +64,6 @@ from psyclone.transformations import (
     ACCDataTrans, ACCEnterDataTrans, ACCLoopTrans,
     ACCParallelTrans, ACCRoutineTrans)
 
-BASE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
-    os.path.abspath(__file__)))), "test_files", "dynamo0p3")
-
 
 # Class ACCRegionDirective
 
@@ -116,18 +110,16 @@ def test_accregiondir_signatures():
 
 
 # (1/4) Method gen_code
-def test_accenterdatadirective_gencode_1():
+def test_accenterdatadirective_gencode_1(get_lfric_invoke):
     '''Test that an OpenACC Enter Data directive, when added to a schedule
     with a single loop, raises the expected exception as there is no
     following OpenACC Parallel or OpenACC Kernels directive as at
     least one is required. This test uses the lfric API.
 
     '''
-    API = "lfric"
     acc_enter_trans = ACCEnterDataTrans()
-    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"), api=API)
-    psy = PSyFactory(api=API, distributed_memory=False).create(info)
-    sched = psy.invokes.get('invoke_0_testkern_type').schedule
+    psy, invoke = get_lfric_invoke("1_single_invoke.f90")
+    sched = invoke.schedule
     acc_enter_trans.apply(sched)
     with pytest.raises(GenerationError) as excinfo:
         str(psy.gen)
@@ -146,18 +138,16 @@ def test_accenterdatadirective_gencode_1():
 
 
 # (2/4) Method gen_code
-def test_accenterdatadirective_gencode_2():
+def test_accenterdatadirective_gencode_2(get_lfric_invoke):
     '''Test that an OpenACC Enter Data directive, when added to a schedule
     with multiple loops, raises the expected exception, as there is no
     following OpenACC Parallel or OpenACCKernels directive and at
     least one is required. This test uses the lfric API.
 
     '''
-    API = "lfric"
     acc_enter_trans = ACCEnterDataTrans()
-    _, info = parse(os.path.join(BASE_PATH, "1.2_multi_invoke.f90"), api=API)
-    psy = PSyFactory(api=API, distributed_memory=False).create(info)
-    sched = psy.invokes.get('invoke_0').schedule
+    psy, invoke = get_lfric_invoke("1.2_multi_invoke.f90")
+    sched = invoke.schedule
     acc_enter_trans.apply(sched)
     with pytest.raises(GenerationError) as excinfo:
         str(psy.gen)
@@ -168,19 +158,17 @@ def test_accenterdatadirective_gencode_2():
 
 # (3/4) Method gen_code
 @pytest.mark.parametrize("trans", [ACCParallelTrans, ACCKernelsTrans])
-def test_accenterdatadirective_gencode_3(trans):
+def test_accenterdatadirective_gencode_3(trans, get_lfric_invoke):
     '''Test that an OpenACC Enter Data directive, when added to a schedule
     with a single loop, produces the expected code (there should be
     "copy in" data as there is a following OpenACC parallel or kernels
     directive). This test uses the lfric API.
 
     '''
-    API = "lfric"
     acc_trans = trans()
     acc_enter_trans = ACCEnterDataTrans()
-    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"), api=API)
-    psy = PSyFactory(api=API, distributed_memory=False).create(info)
-    sched = psy.invokes.get('invoke_0_testkern_type').schedule
+    psy, invoke = get_lfric_invoke("1_single_invoke.f90")
+    sched = invoke.schedule
     acc_trans.apply(sched.children)
     acc_enter_trans.apply(sched)
     code = str(psy.gen)
@@ -196,7 +184,7 @@ def test_accenterdatadirective_gencode_3(trans):
                           (ACCParallelTrans, ACCKernelsTrans),
                           (ACCKernelsTrans, ACCParallelTrans),
                           (ACCKernelsTrans, ACCKernelsTrans)])
-def test_accenterdatadirective_gencode_4(trans1, trans2):
+def test_accenterdatadirective_gencode_4(trans1, trans2, get_lfric_invoke):
     '''Test that an OpenACC Enter Data directive, when added to a schedule
     with multiple loops and multiple OpenACC parallel and/or Kernel
     directives, produces the expected code (when the same argument is
@@ -204,13 +192,11 @@ def test_accenterdatadirective_gencode_4(trans1, trans2):
     uses the lfric API.
 
     '''
-    API = "lfric"
     acc_trans1 = trans1()
     acc_trans2 = trans2()
     acc_enter_trans = ACCEnterDataTrans()
-    _, info = parse(os.path.join(BASE_PATH, "1.2_multi_invoke.f90"), api=API)
-    psy = PSyFactory(api=API, distributed_memory=False).create(info)
-    sched = psy.invokes.get('invoke_0').schedule
+    psy, invoke = get_lfric_invoke("1.2_multi_invoke.f90")
+    sched = invoke.schedule
     acc_trans1.apply([sched.children[1]])
     acc_trans2.apply([sched.children[0]])
     acc_enter_trans.apply(sched)
@@ -370,15 +356,13 @@ def test_acckernelsdirective_init():
 
 # (1/1) Method gen_code
 @pytest.mark.parametrize("default_present", [False, True])
-def test_acckernelsdirective_gencode(default_present):
+def test_acckernelsdirective_gencode(default_present, get_lfric_invoke):
     '''Check that the gen_code method in the ACCKernelsDirective class
     generates the expected code. Use the lfric API.
 
     '''
-    API = "lfric"
-    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"), api=API)
-    psy = PSyFactory(api=API, distributed_memory=False).create(info)
-    sched = psy.invokes.get('invoke_0_testkern_type').schedule
+    psy, invoke = get_lfric_invoke("1_single_invoke.f90")
+    sched = invoke.schedule
 
     trans = ACCKernelsTrans()
     trans.apply(sched, {"default_present": default_present})
@@ -37,7 +37,6 @@
 ''' This module contains pytest tests for the ArrayOfStructuresMember
     class. '''
 
-from __future__ import absolute_import
 import pytest
 from psyclone.psyir import symbols, nodes
 from psyclone.errors import GenerationError, InternalError
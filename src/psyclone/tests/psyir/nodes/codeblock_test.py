@@ -38,7 +38,6 @@
 
 ''' Performs py.test tests on the CodeBlock PSyIR node. '''
 
-from __future__ import absolute_import
 import pytest
 from fparser.common.readfortran import FortranStringReader
 from psyclone.psyir.nodes import CodeBlock
@@ -41,7 +41,6 @@
 import pytest
 
 from psyclone.errors import GenerationError
-from psyclone.psyir.backend.fortran import FortranWriter
 from psyclone.psyir.nodes import (colored, Container, FileContainer,
                                   KernelSchedule, Return, Routine)
 from psyclone.psyir.symbols import DataSymbol, REAL_SINGLE_TYPE, SymbolTable
@@ -99,7 +98,21 @@ def test_container_can_be_printed():
     assert "Container[box]\n" in str(cont_stmt)
 
 
-def test_container_create():
+# Fortran code expected for the Container built in test_container_create.
+EXPECTED_CONTAINER_CODE = (
+    "module container_name\n"
+    "  implicit none\n"
+    "  real, public :: tmp\n"
+    "  public\n\n"
+    "  contains\n"
+    "  subroutine mod_1()\n\n\n"
+    "  end subroutine mod_1\n"
+    "  subroutine mod_2()\n\n\n"
+    "  end subroutine mod_2\n\n"
+    "end module container_name\n")
+
+
+def test_container_create(fortran_writer):
     '''Test that the create method in the Container class correctly
     creates a Container instance.
 
@@ -112,53 +125,37 @@ def test_container_create():
                                  [kernel1, kernel2])
     check_links(container, [kernel1, kernel2])
     assert container.symbol_table is symbol_table
-    result = FortranWriter().container_node(container)
-    assert result == (
-        "module container_name\n"
-        "  implicit none\n"
-        "  real, public :: tmp\n"
-        "  public\n\n"
-        "  contains\n"
-        "  subroutine mod_1()\n\n\n"
-        "  end subroutine mod_1\n"
-        "  subroutine mod_2()\n\n\n"
-        "  end subroutine mod_2\n\n"
-        "end module container_name\n")
-
-
-def test_container_create_invalid():
-    '''Test that the create method in a Container class raises the
-    expected exception if the provided input is invalid.
+    result = fortran_writer.container_node(container)
+    assert result == EXPECTED_CONTAINER_CODE
 
-    '''
-    symbol_table = SymbolTable()
-    symbol_table.add(DataSymbol("x", REAL_SINGLE_TYPE))
-    children = [KernelSchedule.create("mod_1", SymbolTable(), [])]
 
+@pytest.mark.parametrize("arg, value, message", [
     # name is not a string.
-    with pytest.raises(GenerationError) as excinfo:
-        _ = Container.create(1, symbol_table, children)
-    assert ("name argument in create method of Container class "
-            "should be a string but found 'int'.") in str(excinfo.value)
-
+    ("name", 1, "name argument in create method of Container class should "
+     "be a string but found 'int'."),
     # symbol_table not a SymbolTable.
-    with pytest.raises(GenerationError) as excinfo:
-        _ = Container.create("container", "invalid", children)
-    assert ("symbol_table argument in create method of Container class "
-            "should be a SymbolTable but found 'str'.") in str(excinfo.value)
-
+    ("symbol_table", "invalid", "symbol_table argument in create method of "
+     "Container class should be a SymbolTable but found 'str'."),
     # children not a list.
-    with pytest.raises(GenerationError) as excinfo:
-        _ = Container.create("mod_name", symbol_table, "invalid")
-    assert ("children argument in create method of Container class should "
-            "be a list but found 'str'." in str(excinfo.value))
-
+    ("children", "invalid", "children argument in create method of "
+     "Container class should be a list but found 'str'."),
     # contents of children list are not Container or KernelSchedule.
+    ("children", ["invalid"], "Item 'str' can't be child 0 of 'Container'. "
+     "The valid format is: '[Container | Routine | CodeBlock]*'.")])
+def test_container_create_invalid(arg, value, message):
+    '''Test that the create method in a Container class raises the
+    expected exception if the provided input is invalid.
+
+    '''
+    symbol_table = SymbolTable()
+    symbol_table.add(DataSymbol("x", REAL_SINGLE_TYPE))
+    args = {"name": "container",
+            "symbol_table": symbol_table,
+            "children": [KernelSchedule.create("mod_1", SymbolTable(), [])]}
+    args[arg] = value
     with pytest.raises(GenerationError) as excinfo:
-        _ = Container.create("mod_name", symbol_table, ["invalid"])
-    assert ("Item 'str' can't be child 0 of 'Container'. The valid format is:"
-            " '[Container | Routine | CodeBlock]*'."
-            in str(excinfo.value))
+        _ = Container.create(**args)
+    assert message in str(excinfo.value)
 
 
 def test_container_children_validation():
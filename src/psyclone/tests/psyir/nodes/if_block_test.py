@@ -38,7 +38,6 @@
 
 ''' Performs py.test tests on the IfBlock PSyIR node. '''
 
-from __future__ import absolute_import
 import pytest
 from psyclone.psyir.nodes import IfBlock, Literal, Reference, Schedule, \
     Return, Assignment
@@ -39,7 +39,6 @@
 
 ''' Performs py.test tests on the Literal PSyIR node. '''
 
-from __future__ import absolute_import
 import pytest
 from psyclone.psyir.nodes import Literal
 from psyclone.psyir.symbols import ScalarType, ArrayType, \
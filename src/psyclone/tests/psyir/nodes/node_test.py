@@ -38,6 +38,7 @@
 
 ''' Performs py.test tests on the Node PSyIR node. '''
 
+import operator
 import sys
 import os
 import re
@@ -45,8 +46,7 @@ import pytest
 
 from psyclone.domain.lfric.transformations import LFRicLoopFuseTrans
 from psyclone.errors import InternalError, GenerationError
-from psyclone.parse.algorithm import parse
-from psyclone.psyGen import PSyFactory, Kern
+from psyclone.psyGen import Kern
 from psyclone.psyir.backend.debug_writer import DebugWriter
 from psyclone.psyir.nodes import Schedule, Reference, Container, Routine, \
     Assignment, Return, Loop, Literal, Statement, node, KernelSchedule, \
@@ -59,9 +59,6 @@ from psyclone.tests.utilities import get_invoke
 # pylint: disable=redefined-outer-name
 from psyclone.psyir.nodes.node import colored
 
-BASE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
-    os.path.abspath(__file__)))), "test_files", "dynamo0p3")
-
 
 def test_node_parent_check():
     ''' Test that the Node constructor accepts a valid parent node but
@@ -144,17 +141,13 @@ def test_node_str(monkeypatch):
     assert tnode.node_str(True) == "coloured_name_string[]"
 
 
-def test_node_depth():
+def test_node_depth(get_lfric_invoke):
     '''
     Test that the Node class depth method returns the correct value for a
     Node in a tree. The start depth to determine a Node's depth is set to
     0. Depth of a Schedule is 1 and increases for its descendants.
     '''
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "1_single_invoke.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke("1_single_invoke.f90", dist_mem=True)
     schedule = invoke.schedule.detach()
     # Assert that start_depth of any Node (including Schedule) is 0
     assert schedule.START_DEPTH == 0
@@ -269,17 +262,13 @@ def test_node_view_error():
             in str(error.value))
 
 
-def test_node_position():
+def test_node_position(get_lfric_invoke):
     '''
     Test that the Node class position and abs_position methods return
     the correct value for a Node in a tree. The start position is
     set to 0. Relative position starts from 0 and absolute from 1.
     '''
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "4.7_multikernel_invokes.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke("4.7_multikernel_invokes.f90", dist_mem=True)
     schedule = invoke.schedule.detach()
     child = schedule.children[6]
     # Assert that position of a Schedule (no parent Node) is 0
@@ -333,16 +322,12 @@ def test_node_abs_position_error():
     assert "Error in search for Node position in the tree" in str(err.value)
 
 
-def test_node_root():
+def test_node_root(get_lfric_invoke):
     '''
     Test that the Node class root method returns the correct instance
     for a Node in a tree.
     '''
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "4.7_multikernel_invokes.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=False).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke("4.7_multikernel_invokes.f90")
     ru_schedule = invoke.schedule
     # Select a loop and the kernel inside
     ru_loop = ru_schedule.children[1]
@@ -365,55 +350,36 @@ def test_node_annotations():
         "()." in str(excinfo.value))
 
 
-def test_node_args():
+def test_node_args(get_lfric_invoke):
     '''Test that the Node class args method returns the correct arguments
     for Nodes that do not have arguments themselves'''
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "4_multikernel_invokes.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=False).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke("4_multikernel_invokes.f90")
     schedule = invoke.schedule
     loop1 = schedule.children[0]
     kern1 = loop1.loop_body[0]
     loop2 = schedule.children[1]
     kern2 = loop2.loop_body[0]
     # 1) Schedule (not that this is useful)
-    all_args = kern1.arguments.args
-    all_args.extend(kern2.arguments.args)
-    schedule_args = schedule.args
-    for idx, arg in enumerate(all_args):
-        assert arg == schedule_args[idx]
+    assert schedule.args == kern1.arguments.args + kern2.arguments.args
     # 2) Loop1
-    loop1_args = loop1.args
-    for idx, arg in enumerate(kern1.arguments.args):
-        assert arg == loop1_args[idx]
+    assert loop1.args == kern1.arguments.args
     # 3) Loop2
-    loop2_args = loop2.args
-    for idx, arg in enumerate(kern2.arguments.args):
-        assert arg == loop2_args[idx]
+    assert loop2.args == kern2.arguments.args
     # 4) Loop fuse
     ftrans = LFRicLoopFuseTrans()
     ftrans.apply(schedule.children[0], schedule.children[1])
     loop = schedule.children[0]
     kern1 = loop.loop_body[0]
     kern2 = loop.loop_body[1]
-    loop_args = loop.args
-    kern_args = kern1.arguments.args
-    kern_args.extend(kern2.arguments.args)
-    for idx, arg in enumerate(kern_args):
-        assert arg == loop_args[idx]
+    assert loop.args == kern1.arguments.args + kern2.arguments.args
 
 
-def test_node_forward_dependence():
+def test_node_forward_dependence(get_lfric_invoke):
     '''Test that the Node class forward_dependence method returns the
     closest dependent Node after the current Node in the schedule or
     None if none are found.'''
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "15.14.1_multi_aX_plus_Y_builtin.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke(
+        "15.14.1_multi_aX_plus_Y_builtin.f90", dist_mem=True)
     schedule = invoke.schedule
     read4 = schedule.children[4]
     # 1: returns none if none found
@@ -430,49 +396,14 @@ def test_node_forward_dependence():
     # a) check writer returned
     first_loop = schedule.children[0]
     assert first_loop.forward_dependence() == writer
-    # 3: haloexchange dependencies
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "4.5_multikernel_invokes.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
-    schedule = invoke.schedule
-    prev_loop = schedule.children[7]
-    halo_field = schedule.children[8]
-    next_loop = schedule.children[9]
-    # a) previous loop depends on halo exchange
-    assert prev_loop.forward_dependence() == halo_field
-    # b) halo exchange depends on following loop
-    assert halo_field.forward_dependence() == next_loop
-
-    # 4: globalsum dependencies
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "15.14.3_sum_setval_field_builtin.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
-    schedule = invoke.schedule
-    prev_loop = schedule.children[0]
-    sum_loop = schedule.children[1]
-    global_sum_loop = schedule.children[2]
-    next_loop = schedule.children[3]
-    # a) prev loop depends on sum loop
-    assert prev_loop.forward_dependence() == sum_loop
-    # b) sum loop depends on global sum loop
-    assert sum_loop.forward_dependence() == global_sum_loop
-    # c) global sum loop depends on next loop
-    assert global_sum_loop.forward_dependence() == next_loop
-
-
-def test_node_backward_dependence():
+
+
+def test_node_backward_dependence(get_lfric_invoke):
     '''Test that the Node class backward_dependence method returns the
     closest dependent Node before the current Node in the schedule or
     None if none are found.'''
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "15.14.1_multi_aX_plus_Y_builtin.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke(
+        "15.14.1_multi_aX_plus_Y_builtin.f90", dist_mem=True)
     schedule = invoke.schedule
     # 1: loop no backwards dependence
     loop3 = schedule.children[2]
@@ -484,52 +415,31 @@ def test_node_backward_dependence():
     assert last_loop_node.backward_dependence() == prev_dep_loop_node
     # b) previous
     assert prev_dep_loop_node.backward_dependence() == loop3
-    # 3: haloexchange dependencies
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "4.5_multikernel_invokes.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
-    schedule = invoke.schedule
-    loop2 = schedule.children[7]
-    halo_exchange = schedule.children[8]
-    loop3 = schedule.children[9]
-    # a) following loop node depends on halo exchange node
-    result = loop3.backward_dependence()
-    assert result == halo_exchange
-    # b) halo exchange node depends on previous loop node
-    result = halo_exchange.backward_dependence()
-    assert result == loop2
-    # 4: globalsum dependencies
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "15.14.3_sum_setval_field_builtin.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
-    schedule = invoke.schedule
-    loop1 = schedule.children[0]
-    loop2 = schedule.children[1]
-    global_sum = schedule.children[2]
-    loop3 = schedule.children[3]
-    # a) loop3 depends on global sum
-    assert loop3.backward_dependence() == global_sum
-    # b) global sum depends on loop2
-    assert global_sum.backward_dependence() == loop2
-    # c) loop2 (sum) depends on loop1
-    assert loop2.backward_dependence() == loop1
 
 
-def test_node_is_valid_location():
+@pytest.mark.parametrize("algfile, positions", [
+    # Halo exchange dependencies: loop -> halo exchange -> loop.
+    ("4.5_multikernel_invokes.f90", [7, 8, 9]),
+    # Global sum dependencies: loop -> sum loop -> global sum -> loop.
+    ("15.14.3_sum_setval_field_builtin.f90", [0, 1, 2, 3])])
+def test_node_dependence_chain(algfile, positions, get_lfric_invoke):
+    '''Test that the Node class forward_dependence and backward_dependence
+    methods follow a chain of dependent Nodes (involving halo exchanges or
+    global sums) in both directions.'''
+    _, invoke = get_lfric_invoke(algfile, dist_mem=True)
+    nodes = [invoke.schedule.children[pos] for pos in positions]
+    for before, after in zip(nodes, nodes[1:]):
+        assert before.forward_dependence() == after
+        assert after.backward_dependence() == before
+
+
+def test_node_is_valid_location(get_lfric_invoke):
     ''' Test that the Node class is_valid_location method returns True if
     the new location does not break any data dependencies, otherwise it
     returns False.
 
     '''
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "1_single_invoke.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke("1_single_invoke.f90", dist_mem=True)
     schedule = invoke.schedule
     # 1: new node argument is invalid
     anode = schedule.children[0]
@@ -567,11 +477,8 @@ def test_node_is_valid_location():
         anode.is_valid_location(next_node, position="before")
     assert "the node and the location are the same" in str(excinfo.value)
     # 5: valid no previous dependency
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "15.14.1_multi_aX_plus_Y_builtin.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke(
+        "15.14.1_multi_aX_plus_Y_builtin.f90", dist_mem=True)
     schedule = invoke.schedule
     # 6: valid no prev dep
     anode = schedule.children[2]
@@ -680,14 +587,10 @@ def test_node_ancestor_shared_with(fortran_reader):
                             limit=assignment2.parent) is None
 
 
-def test_dag_names():
+def test_dag_names(get_lfric_invoke):
     ''' Test that the dag_name method returns the correct value for the
     node class and its specialisations. '''
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "1_single_invoke.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke("1_single_invoke.f90", dist_mem=True)
     schedule = invoke.schedule
 
     # Classes without the dag_name specialised should show the name of the
@@ -711,11 +614,8 @@ def test_dag_names():
     assert idx.dag_name == "Literal_0"
 
     # GlobalSum and BuiltIn also have specialised dag_names
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "15.14.3_sum_setval_field_builtin.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric", distributed_memory=True).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke(
+        "15.14.3_sum_setval_field_builtin.f90", dist_mem=True)
     schedule = invoke.schedule
     global_sum = schedule.children[2]
     assert global_sum.dag_name == "globalsum(asum)_2"
@@ -741,76 +641,64 @@ def test_node_digraph_no_graphviz(monkeypatch):
     assert dag_class == "DummyDigraph"
 
 
-def test_node_dag_no_graphviz(tmpdir, monkeypatch):
+def test_node_dag_no_graphviz(tmpdir, monkeypatch, get_lfric_invoke):
     ''' Test that the dag generation returns None (and that no file is created)
     when graphviz is not installed. We make this test independent of whether or
     not graphviz is installed by monkeypatching sys.modules. '''
     monkeypatch.setitem(sys.modules, 'graphviz', None)
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "1_single_invoke.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric",
-                     distributed_memory=False).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke("1_single_invoke.f90")
     my_file = tmpdir.join('test')
     dag = invoke.schedule.dag(file_name=my_file.strpath)
     assert dag is None
     assert not os.path.exists(my_file.strpath)
 
 
-def test_node_dag_returns_digraph(monkeypatch):
-    ''' Test that the dag generation returns the expected Digraph object. We
-    make this test independent of whether or not graphviz is installed by
-    monkeypatching the psyir.nodes.node._graphviz_digraph_class function to
-    return a fake digraph class type. '''
-    class FakeDigraph():
-        ''' Fake version of graphviz.Digraph class with key methods
-        implemented as noops. '''
-        # pylint: disable=redefined-builtin
-        def __init__(self, format=None):
-            ''' Fake constructor. '''
+class FakeDigraph():
+    ''' Fake version of graphviz.Digraph class with key methods
+    implemented as noops. '''
+    # pylint: disable=redefined-builtin
+    def __init__(self, format=None):
+        ''' Fake constructor. '''
+
+    def node(self, _name):
+        ''' Fake node method. '''
+
+    def edge(self, _name1, _name2, color="red"):
+        ''' Fake edge method. '''
+
+    def render(self, filename):
+        ''' Fake render method. '''
 
-        def node(self, _name):
-            ''' Fake node method. '''
 
-        def edge(self, _name1, _name2, color="red"):
-            ''' Fake edge method. '''
+class FakeInvalidFormatDigraph():
+    ''' Fake version of graphviz.Digraph class that raises a ValueError
+    when instantiated. '''
+    # pylint: disable=redefined-builtin
+    def __init__(self, format=None):
+        raise ValueError(format)
 
-        def render(self, filename):
-            ''' Fake render method. '''
 
+def test_node_dag_returns_digraph(monkeypatch, get_lfric_invoke):
+    ''' Test that the dag generation returns the expected Digraph object. We
+    make this test independent of whether or not graphviz is installed by
+    monkeypatching the psyir.nodes.node._graphviz_digraph_class function to
+    return a fake digraph class type. '''
     monkeypatch.setattr(node, "_graphviz_digraph_class", lambda: FakeDigraph)
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "1_single_invoke.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric",
-                     distributed_memory=False).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke("1_single_invoke.f90")
     schedule = invoke.schedule
     dag = schedule.dag()
     assert isinstance(dag, FakeDigraph)
 
 
-def test_node_dag_wrong_file_format(monkeypatch):
+def test_node_dag_wrong_file_format(monkeypatch, get_lfric_invoke):
     ''' Test the handling of the error raised by graphviz when it is passed
     an invalid file format. We make this test independent of whether or not
     graphviz is actually available by monkeypatching the
     psyir.nodes.node._graphviz_digraph_class function to return a fake digraph
     class type that mimics the error. '''
-    class FakeDigraph():
-        ''' Fake version of graphviz.Digraph class that raises a ValueError
-        when instantiated. '''
-        # pylint: disable=redefined-builtin
-        def __init__(self, format=None):
-            raise ValueError(format)
-
-    monkeypatch.setattr(node, "_graphviz_digraph_class", lambda: FakeDigraph)
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "1_single_invoke.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric",
-                     distributed_memory=False).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    monkeypatch.setattr(node, "_graphviz_digraph_class",
+                        lambda: FakeInvalidFormatDigraph)
+    _, invoke = get_lfric_invoke("1_single_invoke.f90")
     with pytest.raises(GenerationError) as err:
         invoke.schedule.dag()
     assert "unsupported graphviz file format 'svg' provided" in str(err.value)
@@ -848,20 +736,15 @@ EXPECTED2 = re.compile(
 # pylint: enable=anomalous-backslash-in-string
 
 
-def test_node_dag(tmpdir, have_graphviz):
+def test_node_dag(tmpdir, have_graphviz, get_lfric_invoke):
     ''' Test that dag generation works correctly. Skip the test if
     graphviz is not installed. '''
     if not have_graphviz:
-        return
+        pytest.skip("graphviz is not installed")
     # We may not have graphviz installed so disable pylint error
     # pylint: disable=import-outside-toplevel
     import graphviz
-    _, invoke_info = parse(
-        os.path.join(BASE_PATH, "4.1_multikernel_invokes.f90"),
-        api="lfric")
-    psy = PSyFactory("lfric",
-                     distributed_memory=False).create(invoke_info)
-    invoke = psy.invokes.invoke_list[0]
+    _, invoke = get_lfric_invoke("4.1_multikernel_invokes.f90")
     schedule = invoke.schedule
     my_file = tmpdir.join('test')
     dag = schedule.dag(file_name=my_file.strpath)
@@ -963,36 +846,45 @@ def test_children_validation():
     # Valid nodes are accepted
     assignment.addchild(reference)
 
-    # Check displaced items are also checked when needed
+
+@pytest.fixture(name="loop_node")
+def fixture_loop_node():
+    '''
+    :returns: a Loop with start, stop and step Literals (0, 1 and 2) and a
+        single Assignment in its body.
+    :rtype: :py:class:`psyclone.psyir.nodes.Loop`
+    '''
     start = Literal("0", INTEGER_TYPE)
     stop = Literal("1", INTEGER_TYPE)
     step = Literal("2", INTEGER_TYPE)
     child_node = Assignment.create(Reference(DataSymbol("tmp", REAL_TYPE)),
                                    Reference(DataSymbol("i", REAL_TYPE)))
     loop_variable = DataSymbol("idx", INTEGER_TYPE)
-    loop = Loop.create(loop_variable, start, stop, step, [child_node])
+    return Loop.create(loop_variable, start, stop, step, [child_node])
+
+
+@pytest.mark.parametrize("mutation", [
+    lambda children: children.insert(1, Literal("0", INTEGER_TYPE)),
+    lambda children: children.remove(children[1]),
+    lambda children: operator.delitem(children, 2),
+    lambda children: children.pop(2),
+    lambda children: children.pop(1),
+    lambda children: children.reverse()],
+    ids=["insert", "remove", "del", "pop_step", "pop_stop", "reverse"])
+def test_children_validation_displaced(loop_node, mutation):
+    ''' Test that the children displaced by a list operation are also
+    validated. The Loop node is used as it has a fixed sequence of
+    DataNode children followed by its body. '''
     with pytest.raises(GenerationError):
-        loop.children.insert(1, Literal("0", INTEGER_TYPE))
+        mutation(loop_node.children)
 
-    with pytest.raises(GenerationError):
-        loop.children.remove(stop)
 
-    with pytest.raises(GenerationError):
-        del loop.children[2]
-
-    with pytest.raises(GenerationError):
-        loop.children.pop(2)
-
-    with pytest.raises(GenerationError):
-        loop.children.pop(1)
-
-    with pytest.raises(GenerationError):
-        loop.children.reverse()
-
-    # But in the right circumstances they work fine
-    assert isinstance(loop.children.pop(), Schedule)
-    loop.children.reverse()
-    assert loop.children[0].value == "2"
+def test_children_validation_displaced_valid(loop_node):
+    ''' Test that list operations that displace children work when the
+    resulting children are valid. '''
+    assert isinstance(loop_node.children.pop(), Schedule)
+    loop_node.children.reverse()
+    assert loop_node.children[0].value == "2"
 
 
 def test_children_is_orphan_validation():
@@ -1177,9 +1069,11 @@ def test_lower_to_language_level(monkeypatch):
     ''' Test that Node has a lower_to_language_level() method that \
     recurses to the same method of its children. '''
 
-    # Monkeypatch the lower_to_language_level to just mark a flag
+    # Monkeypatch the lower_to_language_level to just record the visit
+    visits = []
+
     def visited(self):
-        self._visited_flag = True
+        visits.append(self)
     monkeypatch.setattr(Statement, "lower_to_language_level", visited)
 
     testnode = Schedule()
@@ -1193,10 +1087,10 @@ def test_lower_to_language_level(monkeypatch):
     # The generic version returns itself
     assert testnode is lowered
 
-    # Check all children have been visited
-    for child in testnode.children:
-        # This member only exists in the monkeypatched version
-        assert child._visited_flag
+    # Check all children have been visited once, in order
+    assert len(visits) == 2
+    assert visits[0] is node1
+    assert visits[1] is node2
 
 
 def test_replace_with():
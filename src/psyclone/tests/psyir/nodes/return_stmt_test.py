@@ -38,7 +38,6 @@
 
 ''' Performs py.test tests on the Return PSyIR node. '''
 
-from __future__ import absolute_import
 import pytest
 from psyclone.psyir.nodes import Return
 from psyclone.errors import GenerationError
@@ -38,7 +38,6 @@
 
 ''' Performs py.test tests on the Schedule PSyIR node. '''
 
-from __future__ import absolute_import
 import os
 import pytest
 from psyclone.psyir.nodes import Schedule, Assignment, Range, Statement
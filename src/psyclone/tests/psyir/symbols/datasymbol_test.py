@@ -53,19 +53,27 @@ from psyclone.psyir.nodes import (Literal, Reference, BinaryOperation, Return,
                                   CodeBlock)
 
 
+@pytest.mark.parametrize("datatype", [
+    REAL_SINGLE_TYPE, REAL_DOUBLE_TYPE, REAL4_TYPE, REAL8_TYPE,
+    INTEGER_SINGLE_TYPE, INTEGER4_TYPE, CHARACTER_TYPE, BOOLEAN_TYPE])
+def test_datasymbol_initialisation_scalar(datatype):
+    '''Test that a DataSymbol instance can be created with each of the
+    predefined scalar datatypes.'''
+    sym = DataSymbol('a', datatype)
+    assert isinstance(sym, DataSymbol)
+    assert sym.datatype is datatype
+
+
 def test_datasymbol_initialisation():
     '''Test that a DataSymbol instance can be created when valid arguments are
     given, otherwise raise relevant exceptions.'''
 
-    # Test with valid arguments
-    assert isinstance(DataSymbol('a', REAL_SINGLE_TYPE), DataSymbol)
-    assert isinstance(DataSymbol('a', REAL_DOUBLE_TYPE), DataSymbol)
-    assert isinstance(DataSymbol('a', REAL4_TYPE), DataSymbol)
+    # Test with valid arguments (the predefined scalar datatypes are tested
+    # in test_datasymbol_initialisation_scalar)
     kind = DataSymbol('r_def', INTEGER_SINGLE_TYPE)
     real_kind_type = ScalarType(ScalarType.Intrinsic.REAL, kind)
     assert isinstance(DataSymbol('a', real_kind_type),
                       DataSymbol)
-    assert isinstance(DataSymbol('a', INTEGER_SINGLE_TYPE), DataSymbol)
     # Run-time constant with no interface specified.
     sym = DataSymbol('a', REAL_DOUBLE_TYPE, is_constant=True,
                      initial_value=0.0)
@@ -83,13 +91,8 @@ def test_datasymbol_initialisation():
             "initial value or an import or unresolved interface."
             in str(err.value))
 
-    assert isinstance(DataSymbol('a', INTEGER4_TYPE),
-                      DataSymbol)
-
-    assert isinstance(DataSymbol('a', CHARACTER_TYPE), DataSymbol)
     assert isinstance(DataSymbol('a', CHARACTER_TYPE, is_constant=True,
                                  initial_value="hello"), DataSymbol)
-    assert isinstance(DataSymbol('a', BOOLEAN_TYPE), DataSymbol)
     assert isinstance(DataSymbol('a', BOOLEAN_TYPE, is_constant=True,
                                  initial_value=False),
                       DataSymbol)
@@ -106,8 +109,6 @@ def test_datasymbol_initialisation():
     array_type = ArrayType(REAL_SINGLE_TYPE, [ArrayType.Extent.ATTRIBUTE,
                                               ArrayType.Extent.ATTRIBUTE])
     assert isinstance(DataSymbol('a', array_type), DataSymbol)
-    assert isinstance(DataSymbol('a', REAL_SINGLE_TYPE), DataSymbol)
-    assert isinstance(DataSymbol('a', REAL8_TYPE), DataSymbol)
     dim = DataSymbol('dim', INTEGER_SINGLE_TYPE,
                      interface=UnresolvedInterface())
     array_type = ArrayType(REAL_SINGLE_TYPE, [Reference(dim)])
@@ -293,30 +294,6 @@ def test_datasymbol_initial_value_setter_invalid():
             "an ArgumentInterface can not have an initial value."
             in str(error.value))
 
-    with pytest.raises(ValueError) as error:
-        DataSymbol('a', INTEGER_SINGLE_TYPE, initial_value=9.81)
-    assert ("Error setting initial value for symbol 'a'. This DataSymbol "
-            "instance datatype is 'Scalar<INTEGER, SINGLE>' meaning "
-            "the initial value should be") in str(error.value)
-    assert "'int'>' but found " in str(error.value)
-    assert "'float'>'." in str(error.value)
-
-    with pytest.raises(ValueError) as error:
-        DataSymbol('a', CHARACTER_TYPE, initial_value=42)
-    assert ("Error setting initial value for symbol 'a'. This DataSymbol "
-            "instance datatype is 'Scalar<CHARACTER, UNDEFINED>' meaning "
-            "the initial value should be") in str(error.value)
-    assert "'str'>' but found " in str(error.value)
-    assert "'int'>'." in str(error.value)
-
-    with pytest.raises(ValueError) as error:
-        DataSymbol('a', BOOLEAN_TYPE, initial_value="hello")
-    assert ("Error setting initial value for symbol 'a'. This DataSymbol "
-            "instance datatype is 'Scalar<BOOLEAN, UNDEFINED>' meaning "
-            "the initial value should be") in str(error.value)
-    assert "'bool'>' but found " in str(error.value)
-    assert "'str'>'." in str(error.value)
-
     # is_constant specified but without an initial_value
     with pytest.raises(ValueError) as error:
         DataSymbol('a', BOOLEAN_TYPE, is_constant=True)
@@ -325,6 +302,25 @@ def test_datasymbol_initial_value_setter_invalid():
             in str(error.value))
 
 
+@pytest.mark.parametrize("datatype, value, type_str, expected, found", [
+    (INTEGER_SINGLE_TYPE, 9.81, "Scalar<INTEGER, SINGLE>", "int", "float"),
+    (CHARACTER_TYPE, 42, "Scalar<CHARACTER, UNDEFINED>", "str", "int"),
+    (BOOLEAN_TYPE, "hello", "Scalar<BOOLEAN, UNDEFINED>", "bool", "str")])
+def test_datasymbol_initial_value_wrong_type(datatype, value, type_str,
+                                             expected, found):
+    '''Test that the DataSymbol initial_value setter raises the appropriate
+    error if the type of the given value does not match the datatype of
+    the symbol.'''
+    with pytest.raises(ValueError) as error:
+        DataSymbol('a', datatype, initial_value=value)
+    msg = str(error.value)
+    assert ("Error setting initial value for symbol 'a'. This DataSymbol "
+            f"instance datatype is '{type_str}' meaning the initial value "
+            "should be" in msg)
+    assert f"'{expected}'>' but found " in msg
+    assert f"'{found}'>'." in msg
+
+
 def test_datasymbol_is_constant():
     '''Test that the DataSymbol is_constant property returns True if a
     constant value is set and False if it is not.
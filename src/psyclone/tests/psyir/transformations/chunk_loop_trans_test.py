@@ -295,6 +295,54 @@ def test_chunkloop_trans_validate7():
             "CodeBlock node.") in str(excinfo.value)
 
 
+def test_chunkloop_trans_validate_single_assignment(fortran_reader):
+    '''Test the validate method of ChunkLoopTrans when the loop body is a
+    single assignment, which is checked without collecting all the
+    accesses of the body unless it contains a call.'''
+    psyir = fortran_reader.psyir_from_source('''
+        module test_mod
+        contains
+          integer function my_func(x)
+            integer :: x
+            x = x + 1
+            my_func = x
+          end function my_func
+          subroutine test(tmp, n)
+            integer :: i, n
+            integer, intent(inout), dimension(100) :: tmp
+
+            do i=1, n
+              tmp(i) = 2 * tmp(n)
+            enddo
+            do i=1, n
+              n = tmp(i)
+            enddo
+            do i=1, n
+              tmp(i) = my_func(n)
+            enddo
+            do i=1, n
+              tmp(my_func(n)) = 2
+            enddo
+          end subroutine test
+        end module test_mod
+     ''')
+    loops = psyir.walk(Loop)
+    ChunkLoopTrans().validate(loops[0])
+    with pytest.raises(TransformationError) as excinfo:
+        ChunkLoopTrans().validate(loops[1])
+    assert ("Cannot apply a ChunkLoopTrans to this loop because the boundary "
+            "variable 'n' is written to inside the loop body."
+            in str(excinfo.value))
+    # The function call may modify its argument, both when it is on the
+    # rhs and in the indices of the lhs
+    for loop in loops[2:]:
+        with pytest.raises(TransformationError) as excinfo:
+            ChunkLoopTrans().validate(loop)
+        assert ("Cannot apply a ChunkLoopTrans to this loop because the "
+                "boundary variable 'n' is written to inside the loop body."
+                in str(excinfo.value))
+
+
 def test_chunkloop_trans_validation_options(fortran_reader):
     ''' Validation fails if an invalid option map is provided '''
     psyir = fortran_reader.psyir_from_source('''
@@ -229,3 +229,62 @@ do i_out_var = 1, 100, 64
   enddo
 enddo'''
     assert expected in result
+
+
+def test_loop_tiling_2d_trans_validation_chunk(fortran_reader):
+    ''' Validation fails with a message that identifies the loop if one of
+    the loops in the construct can not be chunked. '''
+    psyir = fortran_reader.psyir_from_source('''
+        subroutine test(tmp)
+            integer:: i, j
+            integer, intent(inout), dimension(100,100) :: tmp
+
+            do i=1, 100
+              do j=1, 100, 64
+                tmp(i,j) = 2 * tmp(i,j)
+              enddo
+            enddo
+        end subroutine test
+     ''')
+    outer_loop = psyir.walk(Loop)[0]
+    with pytest.raises(TransformationError) as err:
+        LoopTiling2DTrans().validate(outer_loop)
+    assert ("Error in LoopTiling2DTrans transformation. The inner loop over "
+            "'j' can not be tiled with a tilesize of 32 because:\n"
+            in str(err.value))
+    assert ("Cannot apply a ChunkLoopTrans to a loop with larger step size "
+            "(64) than the chosen chunk size (32)." in str(err.value))
+    # It is valid with a bigger tilesize
+    LoopTiling2DTrans().validate(outer_loop, {"tilesize": 64})
+
+
+def test_loop_tiling_2d_trans_validate_all(fortran_reader):
+    ''' Check that validate_all reports the validity of each of the
+    provided loops without raising an exception. '''
+    psyir = fortran_reader.psyir_from_source('''
+        subroutine test(tmp)
+            integer:: i, j
+            integer, intent(inout), dimension(100,100) :: tmp
+
+            do i=1, 100
+              do j=1, 100
+                tmp(i,j) = 2 * tmp(i,j)
+              enddo
+            enddo
+            do i=1, 100
+              tmp(i,1) = 2 * tmp(i,1)
+            enddo
+        end subroutine test
+     ''')
+    loops = psyir.walk(Loop)
+    results = LoopTiling2DTrans().validate_all([loops[0], loops[2]])
+    assert len(results) == 2
+    assert results[0] == (loops[0], True, "")
+    assert results[1][0] is loops[2]
+    assert results[1][1] is False
+    assert ("must be a sub-class of Loop but got 'Assignment'."
+            in results[1][2])
+    # Invalid options are reported for every loop
+    results = LoopTiling2DTrans().validate_all(loops[0:1], {"tilesize": -1})
+    assert results[0][1] is False
+    assert "positive integer but found '-1'" in results[0][2]
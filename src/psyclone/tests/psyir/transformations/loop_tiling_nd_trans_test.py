@@ -0,0 +1,196 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2024, Science and Technology Facilities Council.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# -----------------------------------------------------------------------------
+
+'''This module contains the unit tests for the LoopTilingNDTrans module'''
+
+import pytest
+
+from psyclone.psyir.nodes import Loop
+from psyclone.psyir.transformations import TransformationError, \
+    LoopTilingNDTrans
+
+CODE_3D = '''
+    subroutine test(tmp)
+        integer:: i, j, k
+        integer, intent(inout), dimension(100,100,100) :: tmp
+
+        do i=1, 100
+          do j=1, 100
+            do k=1, 100
+              tmp(i,j,k) = 2 * tmp(i,j,k)
+            enddo
+          enddo
+        enddo
+    end subroutine test
+    '''
+
+
+def test_loop_tiling_nd_trans():
+    '''Test the base methods of LoopTilingNDTrans'''
+    trans = LoopTilingNDTrans()
+    assert str(trans) == "Tile the loop construct using N-dimensional blocks"
+
+
+def test_loop_tiling_nd_trans_validation(fortran_reader):
+    ''' Validation passes for a 3D nested loop construct and fails if more
+    loops than the available nested loops are requested. '''
+    psyir = fortran_reader.psyir_from_source(CODE_3D)
+    outer_loop = psyir.walk(Loop)[0]
+    LoopTilingNDTrans().validate(outer_loop)
+    LoopTilingNDTrans().validate(outer_loop, {"tilesizes": (8, 8, 8)})
+    with pytest.raises(TransformationError) as err:
+        LoopTilingNDTrans().validate(outer_loop, {"tilesizes": [8, 8, 8, 8]})
+    assert ("Error in LoopTilingNDTrans transformation. The loop nest must "
+            "contain 4 perfectly nested loops but:\n" in str(err.value))
+    assert ("must be a sub-class of Loop but got 'Assignment'."
+            in str(err.value))
+
+
+def test_loop_tiling_nd_trans_validation_options(fortran_reader):
+    ''' Validation fails if an invalid option map is provided '''
+    psyir = fortran_reader.psyir_from_source(CODE_3D)
+    outer_loop = psyir.walk(Loop)[0]
+    with pytest.raises(TransformationError) as err:
+        LoopTilingNDTrans().validate(outer_loop, {'tilesize': 32})
+    assert ("The LoopTilingNDTrans does not support the transformation option"
+            " 'tilesize', the supported options are: ['tilesizes']."
+            in str(err.value))
+
+    for value in (32, [32]):
+        with pytest.raises(TransformationError) as err:
+            LoopTilingNDTrans().validate(outer_loop, {'tilesizes': value})
+        assert (f"The LoopTilingNDTrans tilesizes option must be a list or "
+                f"tuple with at least two positive integers but found "
+                f"'{value}'." in str(err.value))
+
+    for value in ('32', -32, True):
+        with pytest.raises(TransformationError) as err:
+            LoopTilingNDTrans().validate(outer_loop,
+                                         {'tilesizes': [32, value]})
+        assert (f"The LoopTilingNDTrans tilesizes option must only contain "
+                f"positive integers but found '{value}'." in str(err.value))
+
+
+def test_loop_tiling_nd_trans_validation_bounds(fortran_reader):
+    ''' Validation fails if the boundaries of an inner loop depend on the
+    iteration variable of any of the enclosing loops, or if a loop can not
+    be chunked. '''
+    psyir = fortran_reader.psyir_from_source('''
+        subroutine test(tmp)
+            integer:: i, j, k
+            integer, intent(inout), dimension(100,100,100) :: tmp
+
+            do i=1, 100
+              do j=1, 100
+                do k=i, 100
+                  tmp(i,j,k) = 2 * tmp(i,j,k)
+                enddo
+              enddo
+            enddo
+            do i=1, 100
+              do j=1, 100, 64
+                tmp(i,j,1) = 2 * tmp(i,j,1)
+              enddo
+            enddo
+        end subroutine test
+     ''')
+    loops = psyir.walk(Loop)
+    with pytest.raises(TransformationError) as err:
+        LoopTilingNDTrans().validate(loops[0], {"tilesizes": [32, 32, 32]})
+    assert ("Error in LoopTilingNDTrans transformation. The iteration "
+            "variable 'i' is part of the boundary expressions of the inner "
+            "loop over 'k', so the nest can not be tiled." in str(err.value))
+    # Only tiling the two outer loops is valid
+    LoopTilingNDTrans().validate(loops[0], {"tilesizes": [32, 32]})
+
+    with pytest.raises(TransformationError) as err:
+        LoopTilingNDTrans().validate(loops[3])
+    assert ("Error in LoopTilingNDTrans transformation. The loop over 'j' "
+            "can not be tiled with a tilesize of 32 because:\n"
+            in str(err.value))
+    assert ("Cannot apply a ChunkLoopTrans to a loop with larger step size "
+            "(64) than the chosen chunk size (32)." in str(err.value))
+
+
+def test_loop_tiling_nd_trans_apply(fortran_reader, fortran_writer):
+    ''' Check that a 3D loop nest is tiled with the given tile sizes. '''
+    psyir = fortran_reader.psyir_from_source(CODE_3D)
+    outer_loop = psyir.walk(Loop)[0]
+    LoopTilingNDTrans().apply(outer_loop, {"tilesizes": [32, 32, 16]})
+
+    outer_loop = psyir.walk(Loop)[0]
+    result = fortran_writer(outer_loop)
+    expected = '''\
+do i_out_var = 1, 100, 32
+  i_el_inner = MIN(i_out_var + (32 - 1), 100)
+  do j_out_var = 1, 100, 32
+    j_el_inner = MIN(j_out_var + (32 - 1), 100)
+    do k_out_var = 1, 100, 16
+      k_el_inner = MIN(k_out_var + (16 - 1), 100)
+      do i = i_out_var, i_el_inner, 1
+        do j = j_out_var, j_el_inner, 1
+          do k = k_out_var, k_el_inner, 1
+            tmp(i,j,k) = 2 * tmp(i,j,k)
+          enddo
+        enddo
+      enddo
+    enddo
+  enddo
+enddo'''
+    assert expected in result
+
+
+def test_loop_tiling_nd_trans_apply_default(fortran_reader, fortran_writer):
+    ''' Check that by default only the two outermost loops are tiled. '''
+    psyir = fortran_reader.psyir_from_source(CODE_3D)
+    outer_loop = psyir.walk(Loop)[0]
+    LoopTilingNDTrans().apply(outer_loop)
+
+    outer_loop = psyir.walk(Loop)[0]
+    result = fortran_writer(outer_loop)
+    expected = '''\
+do i_out_var = 1, 100, 32
+  i_el_inner = MIN(i_out_var + (32 - 1), 100)
+  do j_out_var = 1, 100, 32
+    j_el_inner = MIN(j_out_var + (32 - 1), 100)
+    do i = i_out_var, i_el_inner, 1
+      do j = j_out_var, j_el_inner, 1
+        do k = 1, 100, 1
+          tmp(i,j,k) = 2 * tmp(i,j,k)
+        enddo
+      enddo
+    enddo
+  enddo
+enddo'''
+    assert expected in result
@@ -53,27 +53,201 @@ from psyclone.psyir.nodes import (colored, ProfileNode, Loop, Literal,
 from psyclone.psyir.symbols import (SymbolTable, REAL_TYPE, DataSymbol)
 from psyclone.psyir.transformations import (ACCKernelsTrans, ProfileTrans,
                                             TransformationError)
-from psyclone.tests.utilities import get_invoke
 from psyclone.transformations import (GOceanOMPLoopTrans,
                                       OMPParallelTrans)
 
 
+# Regular expressions used to check the generated code. They are compiled
+# once with DOTALL, so that '.*' can match across lines of the code.
+
+# The profile region includes both loops. Note that indeed the function
+# 'compute_cv_code' is in the module file kernel_ne_offset_mod.
+GOCEAN_INVOKES_RE = re.compile(
+    "subroutine invoke.*"
+    "use profile_psy_data_mod, ONLY: profile_PSyDataType.*"
+    r"TYPE\(profile_PsyDataType\), target, save :: profile_"
+    r"psy_data.*call profile_psy_data%PreStart\(\"psy_single_"
+    r"invoke_different_iterates_over\", \"invoke_0:r0\", 0, "
+    r"0\).*"
+    "do j.*"
+    "do i.*"
+    "call.*"
+    "end.*"
+    "end.*"
+    r"call profile_psy_data%PostEnd",
+    re.I | re.DOTALL)
+
+GOCEAN_INVOKES_TWO_KERNELS_RE = re.compile(
+    "subroutine invoke.*"
+    "use profile_psy_data_mod, only: profile_PSyDataType.*"
+    r"TYPE\(profile_PSyDataType\), target, save :: "
+    "profile_psy_data.*"
+    r"call profile_psy_data%PreStart\(\"psy_single_invoke_two"
+    r"_kernels\", \"invoke_0:r0\", 0, 0\).*"
+    "do j.*"
+    "do i.*"
+    "call.*"
+    "end.*"
+    "end.*"
+    "do j.*"
+    "do i.*"
+    "call.*"
+    "end.*"
+    "end.*"
+    r"call profile_psy_data%PostEnd",
+    re.I | re.DOTALL)
+
+# This regular expression puts the region names into groups.
+GOCEAN_UNIQUE_REGIONS_RE = re.compile(
+    "subroutine invoke.*"
+    "use profile_psy_Data_mod, only: profile_PSyDataType.*"
+    r"TYPE\(profile_PSyDataType\), target, save :: "
+    "profile_psy_data.*"
+    r"TYPE\(profile_PSyDataType\), target, save :: "
+    "profile_psy_data.*"
+    r"call profile_psy_data.*%PreStart\(\"psy_single_invoke_two"
+    r"_kernels\", "
+    r"\"invoke_0:compute_cu_code:r0\", 0, 0\).*"
+    "do j.*"
+    "do i.*"
+    "call compute_cu_code.*"
+    "end.*"
+    "end.*"
+    r"call profile_psy_data.*%PostEnd.*"
+    r"call profile_psy_data.*%PreStart\(\"psy_single_invoke_two_"
+    r"kernels\", \"invoke_0:compute_cu_code:r1\", 0, 0\).*"
+    "do j.*"
+    "do i.*"
+    "call compute_cu_code.*"
+    "end.*"
+    "end.*"
+    r"call profile_psy_data.*%PostEnd",
+    re.I | re.DOTALL)
+
+# Kernel profiling of two kernel calls in a single invoke subroutine must
+# create a separate profile region (with a different variable) around each
+# loop nest.
+# The '.*' after compute_cu_code is necessary since the name could be
+# changed to avoid duplicates (depending on order in which the tests are
+# executed).
+GOCEAN_KERNELS_RE = re.compile(
+    "subroutine invoke.*"
+    "use profile_psy_data_mod, only: profile_PSyDataType.*"
+    r"TYPE\(profile_PSyDataType\), target, save :: "
+    "profile_psy_data.*"
+    r"TYPE\(profile_PSyDataType\), target, save :: "
+    "profile_psy_data.*"
+    r"call (?P<profile1>\w*)%PreStart\(\"psy_single_invoke_two"
+    r"_kernels\", \"invoke_0:compute_cu_code:r0\", 0, 0\).*"
+    "do j.*"
+    "do i.*"
+    "call.*"
+    "end.*"
+    "end.*"
+    r"call (?P=profile1)%PostEnd.*"
+    r"call (?P<profile2>\w*)%PreStart\(\"psy_single_invoke_two"
+    r"_kernels\", \"invoke_0:time_smooth_code:r1\", 0, 0\).*"
+    "do j.*"
+    "do i.*"
+    "call.*"
+    "end.*"
+    "end.*"
+    r"call (?P=profile2)%PostEnd",
+    re.I | re.DOTALL)
+
+LFRIC_INVOKES_RE = re.compile(
+    "subroutine invoke.*"
+    "use profile_psy_data_mod, only: profile_PSyDataType.*"
+    r"TYPE\(profile_PSyDataType\), target, save :: "
+    "profile_psy_data.*"
+    r"call profile_psy_data%PreStart\(\"single_invoke_psy\", "
+    r"\"invoke_0_testkern_type:testkern_code:r0\", 0, 0\).*"
+    "do cell.*"
+    "call.*"
+    "end.*"
+    r"call profile_psy_data%PostEnd",
+    re.I | re.DOTALL)
+
+# The .* after r0 is necessary since the name can be changed by PSyclone
+# to avoid name duplications.
+LFRIC_INVOKES_MULTI_RE = re.compile(
+    "subroutine invoke.*"
+    "use profile_psy_data_mod, only: profile_PSyDataType.*"
+    r"TYPE\(profile_PSyDataType\), target, save :: "
+    "profile_psy_data.*"
+    r"call profile_psy_data%PreStart\(\"multi_invoke_psy\", "
+    r"\"invoke_0:r0.*\", 0, 0\).*"
+    "do cell.*"
+    "call.*"
+    "end.*"
+    "do cell.*"
+    "call.*"
+    "end.*"
+    r"call profile_psy_data%PostEnd",
+    re.I | re.DOTALL)
+
+LFRIC_KERNELS_RE = re.compile(
+    "subroutine invoke.*"
+    "use profile_psy_data_mod, only: profile_PSyDataType.*"
+    r"TYPE\(profile_PSyDataType\), target, save :: "
+    "profile_psy_data.*"
+    r"call profile_psy_data%PreStart\(\"single_invoke_psy\", "
+    r"\"invoke_0_testkern_type:testkern_code:r0.*\", 0, 0\).*"
+    "do cell.*"
+    "call.*"
+    "end.*"
+    r"call profile_psy_data%PostEnd",
+    re.I | re.DOTALL)
+
+LFRIC_KERNELS_MULTI_RE = re.compile(
+    "subroutine invoke.*"
+    "use profile_psy_data_mod, only: profile_PSyDataType.*"
+    r"TYPE\(profile_PSyDataType\), target, save :: "
+    r"(?P<profile2>\w*)\s.*"
+    r"TYPE\(profile_PSyDataType\), target, save :: "
+    r"(?P<profile1>\w*)\s.*"
+    r"call (?P=profile1)%PreStart\(\"multi_invoke_psy\", "
+    r"\"invoke_0:testkern_code:r0\", 0, 0\).*"
+    "do cell.*"
+    "call.*"
+    "end.*"
+    r"call (?P=profile1)%PostEnd.*"
+    r"call (?P=profile2)%PreStart\(\"multi_invoke_psy\", "
+    r"\"invoke_0:testkern_code:r1\", 0, 0\).*"
+    "do cell.*"
+    "call.*"
+    "end.*"
+    r"call (?P=profile2)%PostEnd",
+    re.I | re.DOTALL)
+
+TRANSFORM_VIEW_RE = re.compile(
+    ".*GOInvokeSchedule.*?"
+    r"Profile.*?"
+    r"Loop.*\[type='outer'.*?"
+    r"Loop.*\[type='outer'.*?"
+    r"Loop.*\[type='outer'",
+    re.DOTALL)
+
+
 # -----------------------------------------------------------------------------
-def teardown_function():
-    '''This function is called at the end of any test function. It disables
-    any automatic profiling set. This is necessary in case of a test failure
-    to make sure any further tests will not be run with profiling enabled.
+@pytest.fixture(scope="function", autouse=True)
+def disable_profiling():
+    '''Disables any automatic profiling at the end of each test. This is
+    necessary in case of a test failure to make sure any further tests will
+    not be run with profiling enabled.
     '''
+    yield
     Profiler._options = []
 
 
 # -----------------------------------------------------------------------------
-def test_profile_basic():
+def test_profile_basic(get_cached_invoke):
     '''Check basic functionality: node names, schedule view.
     '''
     Profiler.set_options([Profiler.INVOKES], api="gocean")
-    _, invoke = get_invoke("test11_different_iterates_over_one_invoke.f90",
-                           "gocean", idx=0, dist_mem=False)
+    _, invoke = get_cached_invoke(
+        "test11_different_iterates_over_one_invoke.f90", "gocean", idx=0,
+        dist_mem=False)
     Profiler.add_profile_nodes(invoke.schedule, Loop)
 
     assert isinstance(invoke.schedule[0], ProfileNode)
@@ -82,8 +256,8 @@ def test_profile_basic():
 
     gsched = colored("GOInvokeSchedule", GOInvokeSchedule._colour)
     sched = colored("Schedule", Schedule._colour)
-    loop = Loop().coloured_name(True)
-    profile = invoke.schedule[0].coloured_name(True)
+    loop = colored("Loop", Loop._colour)
+    profile = colored("Profile", ProfileNode._colour)
 
     # Do one test based on schedule view, to make sure colouring
     # and indentation is correct
@@ -108,8 +282,6 @@ def test_profile_basic():
     assert invoke.schedule[0].psy_data_body[0].loop_body[0].children[0].\
         children[0] is node
 
-    Profiler._options = []
-
 
 # -----------------------------------------------------------------------------
 def test_profile_errors2():
@@ -126,173 +298,67 @@ def test_profile_errors2():
 
 
 # -----------------------------------------------------------------------------
-def test_profile_invokes_gocean1p0():
-    '''Check that an invoke is instrumented correctly
+@pytest.mark.parametrize("api, algfile, dist_mem, option, expected_re", [
+    ("gocean", "test11_different_iterates_over_one_invoke.f90", None,
+     Profiler.INVOKES, GOCEAN_INVOKES_RE),
+    ("gocean", "single_invoke_two_kernels.f90", False,
+     Profiler.INVOKES, GOCEAN_INVOKES_TWO_KERNELS_RE),
+    ("gocean", "single_invoke_two_kernels.f90", False,
+     Profiler.KERNELS, GOCEAN_KERNELS_RE),
+    ("lfric", "1_single_invoke.f90", None,
+     Profiler.INVOKES, LFRIC_INVOKES_RE),
+    ("lfric", "1.2_multi_invoke.f90", None,
+     Profiler.INVOKES, LFRIC_INVOKES_MULTI_RE),
+    ("lfric", "1_single_invoke.f90", None,
+     Profiler.KERNELS, LFRIC_KERNELS_RE),
+    ("lfric", "1.2_multi_invoke.f90", None,
+     Profiler.KERNELS, LFRIC_KERNELS_MULTI_RE)])
+def test_profile_invokes_and_kernels(api, algfile, dist_mem, option,
+                                     expected_re, get_cached_invoke):
+    '''Check that invokes and kernels are instrumented correctly by the
+    automatic profiling options in the GOcean and LFRic APIs.
+
     '''
-    Profiler.set_options([Profiler.INVOKES], "gocean")
-    _, invoke = get_invoke("test11_different_iterates_over_one_invoke.f90",
-                           "gocean", idx=0)
+    Profiler.set_options([option], api)
+    _, invoke = get_cached_invoke(algfile, api, idx=0, dist_mem=dist_mem)
     Profiler.add_profile_nodes(invoke.schedule, Loop)
+    code = str(invoke.gen())
 
-    # Convert the invoke to code, and remove all new lines, to make
-    # regex matching easier
-    code = str(invoke.gen()).replace("\n", "")
-
-    # First a simple test that the nesting is correct - the
-    # profile regions include both loops. Note that indeed
-    # the function 'compute_cv_code' is in the module file
-    # kernel_ne_offset_mod.
-    correct_re = ("subroutine invoke.*"
-                  "use profile_psy_data_mod, ONLY: profile_PSyDataType.*"
-                  r"TYPE\(profile_PsyDataType\), target, save :: profile_"
-                  r"psy_data.*call profile_psy_data%PreStart\(\"psy_single_"
-                  r"invoke_different_iterates_over\", \"invoke_0:r0\", 0, "
-                  r"0\).*"
-                  "do j.*"
-                  "do i.*"
-                  "call.*"
-                  "end.*"
-                  "end.*"
-                  r"call profile_psy_data%PostEnd")
-    assert re.search(correct_re, code, re.I) is not None
+    groups = expected_re.search(code)
+    assert groups is not None
+    # Check that the profile variables, if captured, are different
+    assert len(set(groups.groups())) == len(groups.groups())
 
     # Check that if gen() is called more than once the same profile
     # variables and region names are created:
-    code_again = str(invoke.gen()).replace("\n", "")
+    code_again = str(invoke.gen())
     assert code == code_again
 
-    # Test that two kernels in one invoke get instrumented correctly.
-    _, invoke = get_invoke("single_invoke_two_kernels.f90", "gocean", 0,
-                           dist_mem=False)
-    Profiler.add_profile_nodes(invoke.schedule, Loop)
-
-    # Convert the invoke to code, and remove all new lines, to make
-    # regex matching easier
-    code = str(invoke.gen()).replace("\n", "")
-
-    correct_re = ("subroutine invoke.*"
-                  "use profile_psy_data_mod, only: profile_PSyDataType.*"
-                  r"TYPE\(profile_PSyDataType\), target, save :: "
-                  "profile_psy_data.*"
-                  r"call profile_psy_data%PreStart\(\"psy_single_invoke_two"
-                  r"_kernels\", \"invoke_0:r0\", 0, 0\).*"
-                  "do j.*"
-                  "do i.*"
-                  "call.*"
-                  "end.*"
-                  "end.*"
-                  "do j.*"
-                  "do i.*"
-                  "call.*"
-                  "end.*"
-                  "end.*"
-                  r"call profile_psy_data%PostEnd")
-    assert re.search(correct_re, code, re.I) is not None
-    Profiler._options = []
-
 
 # -----------------------------------------------------------------------------
-def test_unique_region_names():
+def test_unique_region_names(get_cached_invoke):
     '''Test that unique region names are created even when the kernel
     names are identical.'''
 
     Profiler.set_options([Profiler.KERNELS], "gocean")
-    _, invoke = get_invoke("single_invoke_two_identical_kernels.f90",
-                           "gocean", 0, dist_mem=False)
+    _, invoke = get_cached_invoke("single_invoke_two_identical_kernels.f90",
+                                  "gocean", 0, dist_mem=False)
     Profiler.add_profile_nodes(invoke.schedule, Loop)
+    code = str(invoke.gen())
 
-    # Convert the invoke to code, and remove all new lines, to make
-    # regex matching easier
-
-    code = str(invoke.gen()).replace("\n", "")
-
-    # This regular expression puts the region names into groups.
     # Make sure that the created regions have different names, even
     # though the kernels have the same name.
-    correct_re = ("subroutine invoke.*"
-                  "use profile_psy_Data_mod, only: profile_PSyDataType.*"
-                  r"TYPE\(profile_PSyDataType\), target, save :: "
-                  "profile_psy_data.*"
-                  r"TYPE\(profile_PSyDataType\), target, save :: "
-                  "profile_psy_data.*"
-                  r"call profile_psy_data.*%PreStart\(\"psy_single_invoke_two"
-                  r"_kernels\", "
-                  r"\"invoke_0:compute_cu_code:r0\", 0, 0\).*"
-                  "do j.*"
-                  "do i.*"
-                  "call compute_cu_code.*"
-                  "end.*"
-                  "end.*"
-                  r"call profile_psy_data.*%PostEnd.*"
-                  r"call profile_psy_data.*%PreStart\(\"psy_single_invoke_two_"
-                  r"kernels\", \"invoke_0:compute_cu_code:r1\", 0, 0\).*"
-                  "do j.*"
-                  "do i.*"
-                  "call compute_cu_code.*"
-                  "end.*"
-                  "end.*"
-                  r"call profile_psy_data.*%PostEnd")
-
-    assert re.search(correct_re, code, re.I) is not None
-
-
-# -----------------------------------------------------------------------------
-def test_profile_kernels_gocean1p0():
-    '''Check that all kernels are instrumented correctly
-    '''
-    Profiler.set_options([Profiler.KERNELS], "gocean")
-    _, invoke = get_invoke("single_invoke_two_kernels.f90", "gocean",
-                           idx=0, dist_mem=False)
-    Profiler.add_profile_nodes(invoke.schedule, Loop)
-
-    # Convert the invoke to code, and remove all new lines, to make
-    # regex matching easier
-    code = str(invoke.gen()).replace("\n", "")
-
-    # Test that kernel profiling works in case of two kernel calls
-    # in a single invoke subroutine - i.e. we need to have one profile
-    # start call before two nested loops, and one profile end call
-    # after that.
-    # Also note that the '.*' after compute_cu_code is necessary since
-    # the name could be changed to avoid duplicates (depending on order
-    # in which the tests are executed).
-    correct_re = ("subroutine invoke.*"
-                  "use profile_psy_data_mod, only: profile_PSyDataType.*"
-                  r"TYPE\(profile_PSyDataType\), target, save :: "
-                  "profile_psy_data.*"
-                  r"TYPE\(profile_PSyDataType\), target, save :: "
-                  "profile_psy_data.*"
-                  r"call (?P<profile1>\w*)%PreStart\(\"psy_single_invoke_two"
-                  r"_kernels\", \"invoke_0:compute_cu_code:r0\", 0, 0\).*"
-                  "do j.*"
-                  "do i.*"
-                  "call.*"
-                  "end.*"
-                  "end.*"
-                  r"call (?P=profile1)%PostEnd.*"
-                  r"call (?P<profile2>\w*)%PreStart\(\"psy_single_invoke_two"
-                  r"_kernels\", \"invoke_0:time_smooth_code:r1\", 0, 0\).*"
-                  "do j.*"
-                  "do i.*"
-                  "call.*"
-                  "end.*"
-                  "end.*"
-                  r"call (?P=profile2)%PostEnd")
-    groups = re.search(correct_re, code, re.I)
-    assert groups is not None
-    assert groups.group(1) != groups.group(2)
-
-    Profiler._options = []
+    assert GOCEAN_UNIQUE_REGIONS_RE.search(code) is not None
 
 
 # -----------------------------------------------------------------------------
-def test_profile_named_gocean1p0():
+def test_profile_named_gocean1p0(get_cached_invoke):
     '''Check that the gocean 1.0 API is instrumented correctly when the
     profile name is supplied by the user.
 
     '''
-    psy, invoke = get_invoke("test11_different_iterates_over_one_invoke.f90",
-                             "gocean", idx=0)
+    psy, invoke = get_cached_invoke(
+        "test11_different_iterates_over_one_invoke.f90", "gocean", idx=0)
     schedule = invoke.schedule
     profile_trans = ProfileTrans()
     options = {"region_name": (psy.name, invoke.name)}
@@ -304,57 +370,13 @@ def test_profile_named_gocean1p0():
 
 
 # -----------------------------------------------------------------------------
-def test_profile_invokes_dynamo0p3():
-    '''Check that a Dynamo 0.3 invoke is instrumented correctly
+def test_profile_invokes_builtin_dynamo0p3(get_cached_invoke):
+    '''Check that a Dynamo 0.3 invoke whose first kernel is a builtin is
+    instrumented correctly.
     '''
     Profiler.set_options([Profiler.INVOKES], "lfric")
-
-    # First test for a single invoke with a single kernel work as expected:
-    _, invoke = get_invoke("1_single_invoke.f90", "lfric", idx=0)
-    Profiler.add_profile_nodes(invoke.schedule, Loop)
-
-    # Convert the invoke to code, and remove all new lines, to make
-    # regex matching easier
-    code = str(invoke.gen()).replace("\n", "")
-
-    correct_re = ("subroutine invoke.*"
-                  "use profile_psy_data_mod, only: profile_PSyDataType.*"
-                  r"TYPE\(profile_PSyDataType\), target, save :: "
-                  "profile_psy_data.*"
-                  r"call profile_psy_data%PreStart\(\"single_invoke_psy\", "
-                  r"\"invoke_0_testkern_type:testkern_code:r0\", 0, 0\).*"
-                  "do cell.*"
-                  "call.*"
-                  "end.*"
-                  r"call profile_psy_data%PostEnd")
-    assert re.search(correct_re, code, re.I) is not None
-
-    # Next test two kernels in one invoke:
-    _, invoke = get_invoke("1.2_multi_invoke.f90", "lfric", idx=0)
-    Profiler.add_profile_nodes(invoke.schedule, Loop)
-    # Convert the invoke to code, and remove all new lines, to make
-    # regex matching easier
-    code = str(invoke.gen()).replace("\n", "")
-
-    # The .* after testkern_code is necessary since the name can be changed
-    # by PSyclone to avoid name duplications.
-    correct_re = ("subroutine invoke.*"
-                  "use profile_psy_data_mod, only: profile_PSyDataType.*"
-                  r"TYPE\(profile_PSyDataType\), target, save :: "
-                  "profile_psy_data.*"
-                  r"call profile_psy_data%PreStart\(\"multi_invoke_psy\", "
-                  r"\"invoke_0:r0.*\", 0, 0\).*"
-                  "do cell.*"
-                  "call.*"
-                  "end.*"
-                  "do cell.*"
-                  "call.*"
-                  "end.*"
-                  r"call profile_psy_data%PostEnd")
-    assert re.search(correct_re, code, re.I) is not None
-
-    # Lastly, test an invoke whose first kernel is a builtin
-    _, invoke = get_invoke("15.1.1_X_plus_Y_builtin.f90", "lfric", idx=0)
+    _, invoke = get_cached_invoke("15.1.1_X_plus_Y_builtin.f90", "lfric",
+                                  idx=0)
     Profiler.add_profile_nodes(invoke.schedule, Loop)
     code = str(invoke.gen())
     assert "USE profile_psy_data_mod, ONLY: profile_PSyDataType" in code
@@ -364,77 +386,16 @@ def test_profile_invokes_dynamo0p3():
            "\"invoke_0:x_plus_y:r0\", 0, 0)" in code
     assert "CALL profile_psy_data%PostEnd" in code
 
-    Profiler._options = []
-
-
-# -----------------------------------------------------------------------------
-def test_profile_kernels_dynamo0p3():
-    '''Check that all kernels are instrumented correctly in a
-    Dynamo 0.3 invoke.
-    '''
-    Profiler.set_options([Profiler.KERNELS], "lfric")
-    _, invoke = get_invoke("1_single_invoke.f90", "lfric", idx=0)
-    Profiler.add_profile_nodes(invoke.schedule, Loop)
-
-    # Convert the invoke to code, and remove all new lines, to make
-    # regex matching easier
-    code = str(invoke.gen()).replace("\n", "")
-
-    correct_re = ("subroutine invoke.*"
-                  "use profile_psy_data_mod, only: profile_PSyDataType.*"
-                  r"TYPE\(profile_PSyDataType\), target, save :: "
-                  "profile_psy_data.*"
-                  r"call profile_psy_data%PreStart\(\"single_invoke_psy\", "
-                  r"\"invoke_0_testkern_type:testkern_code:r0.*\", 0, 0\).*"
-                  "do cell.*"
-                  "call.*"
-                  "end.*"
-                  r"call profile_psy_data%PostEnd")
-    assert re.search(correct_re, code, re.I) is not None
-
-    _, invoke = get_invoke("1.2_multi_invoke.f90", "lfric", idx=0)
-    Profiler.add_profile_nodes(invoke.schedule, Loop)
-
-    # Convert the invoke to code, and remove all new lines, to make
-    # regex matching easier
-    code = str(invoke.gen()).replace("\n", "")
-
-    correct_re = ("subroutine invoke.*"
-                  "use profile_psy_data_mod, only: profile_PSyDataType.*"
-                  r"TYPE\(profile_PSyDataType\), target, save :: "
-                  r"(?P<profile2>\w*) .*"
-                  r"TYPE\(profile_PSyDataType\), target, save :: "
-                  r"(?P<profile1>\w*) .*"
-                  r"call (?P=profile1)%PreStart\(\"multi_invoke_psy\", "
-                  r"\"invoke_0:testkern_code:r0\", 0, 0\).*"
-                  "do cell.*"
-                  "call.*"
-                  "end.*"
-                  r"call (?P=profile1)%PostEnd.*"
-                  r"call (?P=profile2)%PreStart\(\"multi_invoke_psy\", "
-                  r"\"invoke_0:testkern_code:r1\", 0, 0\).*"
-                  "do cell.*"
-                  "call.*"
-                  "end.*"
-                  r"call (?P=profile2)%PostEnd")
-
-    groups = re.search(correct_re, code, re.I)
-    assert groups is not None
-    # Check that the variables are different
-    assert groups.group(1) != groups.group(2)
-
-    Profiler._options = []
-
 
 # -----------------------------------------------------------------------------
-def test_profile_fused_kernels_dynamo0p3():
+def test_profile_fused_kernels_dynamo0p3(get_cached_invoke):
     '''Check that kernels are instrumented correctly in an LFRic
     (Dynamo 0.3) invoke which has had them fused (i.e. there is more than
     one Kernel inside a loop).
     '''
     Profiler.set_options([Profiler.KERNELS], "lfric")
-    _, invoke = get_invoke("1.2_multi_invoke.f90", "lfric", idx=0,
-                           dist_mem=False)
+    _, invoke = get_cached_invoke("1.2_multi_invoke.f90", "lfric", idx=0,
+                                  dist_mem=False)
 
     fuse_trans = LFRicLoopFuseTrans()
     loops = invoke.schedule.walk(Loop)
@@ -457,15 +418,15 @@ undf_w3, map_w3(:,cell))
 
 
 # -----------------------------------------------------------------------------
-def test_profile_kernels_without_loop_dynamo0p3():
+def test_profile_kernels_without_loop_dynamo0p3(get_cached_invoke):
     '''Check that kernels are instrumented correctly in an LFRic
     (Dynamo 0.3) invoke when there is no parent loop. This is currently
     impossible so we construct an artificial Schedule to test.
 
     '''
     Profiler.set_options([Profiler.KERNELS], "lfric")
-    _, invoke = get_invoke("1.2_multi_invoke.f90", "lfric", idx=0,
-                           dist_mem=False)
+    _, invoke = get_cached_invoke("1.2_multi_invoke.f90", "lfric", idx=0,
+                                  dist_mem=False)
 
     # Create a new Routine and copy over the Kernels from the invoke schedule.
     new_sched = Routine("test_routine")
@@ -479,13 +440,13 @@ def test_profile_kernels_without_loop_dynamo0p3():
 
 
 # -----------------------------------------------------------------------------
-def test_profile_kernels_in_directive_dynamo0p3():
+def test_profile_kernels_in_directive_dynamo0p3(get_cached_invoke):
     '''
     Check that a kernel is instrumented correctly if it is within a directive.
     '''
     Profiler.set_options([Profiler.KERNELS], "lfric")
-    _, invoke = get_invoke("1_single_invoke_w3.f90", "lfric", idx=0,
-                           dist_mem=False)
+    _, invoke = get_cached_invoke("1_single_invoke_w3.f90", "lfric", idx=0,
+                                  dist_mem=False)
     ktrans = ACCKernelsTrans()
     loop = invoke.schedule.walk(Loop)[0]
     ktrans.apply(loop)
@@ -501,12 +462,12 @@ def test_profile_kernels_in_directive_dynamo0p3():
 
 
 # -----------------------------------------------------------------------------
-def test_profile_named_dynamo0p3():
+def test_profile_named_dynamo0p3(get_cached_invoke):
     '''Check that the Dynamo 0.3 API is instrumented correctly when the
     profile name is supplied by the user.
 
     '''
-    psy, invoke = get_invoke("1_single_invoke.f90", "lfric", idx=0)
+    psy, invoke = get_cached_invoke("1_single_invoke.f90", "lfric", idx=0)
     schedule = invoke.schedule
     profile_trans = ProfileTrans()
     options = {"region_name": (psy.name, invoke.name)}
@@ -517,11 +478,11 @@ def test_profile_named_dynamo0p3():
 
 
 # -----------------------------------------------------------------------------
-def test_transform():
+def test_transform(get_cached_invoke):
     '''Tests normal behaviour of profile region transformation.'''
 
-    _, invoke = get_invoke("test27_loop_swap.f90", "gocean",
-                           name="invoke_loop1", dist_mem=False)
+    _, invoke = get_cached_invoke("test27_loop_swap.f90", "gocean",
+                                  name="invoke_loop1", dist_mem=False)
     schedule = invoke.schedule
 
     prt = ProfileTrans()
@@ -559,15 +520,15 @@ def test_transform():
 
 
 # -----------------------------------------------------------------------------
-def test_transform_errors():
+def test_transform_errors(get_cached_invoke):
     '''Tests error handling of the profile region transformation. Most of
     it is already covered in PSyDataTrans, but we need also to verify
     that the right transformation and node name is used.'''
 
     # This has been imported and tested before, so we can assume
     # here that this all works as expected/
-    _, invoke = get_invoke("test27_loop_swap.f90", "gocean",
-                           name="invoke_loop1", dist_mem=False)
+    _, invoke = get_cached_invoke("test27_loop_swap.f90", "gocean",
+                                  name="invoke_loop1", dist_mem=False)
 
     schedule = invoke.schedule
     prt = ProfileTrans()
@@ -576,21 +537,14 @@ def test_transform_errors():
     prt.apply([schedule.children[0],
                schedule.children[1],
                schedule.children[2]])
-    out = schedule.view()
-    # out is unicode, and has no replace function, so convert to string first
-    out = str(out).replace("\n", "")
+    out = schedule.view(colour=False)
 
-    correct_re = (".*GOInvokeSchedule.*?"
-                  r"Profile.*?"
-                  r"Loop.*\[type='outer'.*?"
-                  r"Loop.*\[type='outer'.*?"
-                  r"Loop.*\[type='outer'")
-    assert re.search(correct_re, out)
+    assert TRANSFORM_VIEW_RE.search(out)
 
     # Test that we don't add a profile node inside a OMP do loop (which
     # would be invalid syntax):
-    _, invoke = get_invoke("test27_loop_swap.f90", "gocean",
-                           name="invoke_loop1", dist_mem=False)
+    _, invoke = get_cached_invoke("test27_loop_swap.f90", "gocean",
+                                  name="invoke_loop1", dist_mem=False)
     schedule = invoke.schedule
 
     prt = ProfileTrans()
@@ -616,14 +570,14 @@ def test_transform_errors():
 
 
 # -----------------------------------------------------------------------------
-def test_region():
+def test_region(get_cached_invoke):
     ''' Tests that the profiling transform works correctly when a region of
     code is specified that does not cover the full invoke and also
     contains multiple kernels.
 
     '''
-    _, invoke = get_invoke("3.1_multi_functions_multi_invokes.f90",
-                           "lfric", name="invoke_0", dist_mem=True)
+    _, invoke = get_cached_invoke("3.1_multi_functions_multi_invokes.f90",
+                                  "lfric", name="invoke_0", dist_mem=True)
     schedule = invoke.schedule
     prt = ProfileTrans()
     # Just halo exchanges.
@@ -650,13 +604,13 @@ def test_region():
 
 
 # -----------------------------------------------------------------------------
-def test_multi_prefix_profile(monkeypatch):
+def test_multi_prefix_profile(monkeypatch, get_cached_invoke):
     ''' Tests that the profiling transform works correctly when we use two
     different profiling tools in the same invoke.
 
     '''
-    _, invoke = get_invoke("3.1_multi_functions_multi_invokes.f90",
-                           "lfric", name="invoke_0", dist_mem=True)
+    _, invoke = get_cached_invoke("3.1_multi_functions_multi_invokes.f90",
+                                  "lfric", name="invoke_0", dist_mem=True)
     schedule = invoke.schedule
     prt = ProfileTrans()
     config = Config.get()
@@ -694,12 +648,12 @@ def test_multi_prefix_profile(monkeypatch):
 
 
 # -----------------------------------------------------------------------------
-def test_omp_transform():
+def test_omp_transform(get_cached_invoke):
     '''Tests that the profiling transform works correctly with OMP
      parallelisation.'''
 
-    _, invoke = get_invoke("test27_loop_swap.f90", "gocean",
-                           name="invoke_loop1", dist_mem=False)
+    _, invoke = get_cached_invoke("test27_loop_swap.f90", "gocean",
+                                  name="invoke_loop1", dist_mem=False)
     schedule = invoke.schedule
 
     prt = ProfileTrans()